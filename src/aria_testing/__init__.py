@@ -22,6 +22,7 @@ from .assertions import (
     GetByText,
 )
 from .errors import AriaTestingLibraryError, ElementNotFoundError, MultipleElementsError
+from .index import ElementIndex, build_index
 from .queries import (
     AriaRole,
     Container,
@@ -38,6 +39,7 @@ from .queries import (
     get_by_tag_name,
     get_by_test_id,
     get_by_text,
+    multi_query,
     query_all_by_class,
     query_all_by_label_text,
     query_all_by_role,
@@ -82,6 +84,7 @@ __all__ = [
     "query_by_class",
     "get_all_by_class",
     "query_all_by_class",
+    "multi_query",
     # Assertion helpers
     "GetByRole",
     "GetByText",
@@ -99,6 +102,7 @@ __all__ = [
     # Utilities
     "get_text_content",
     "normalize_text",
+    "build_index",
     # Errors
     "AriaTestingLibraryError",
     "ElementNotFoundError",
@@ -106,4 +110,5 @@ __all__ = [
     # Type exports
     "AriaRole",
     "Container",
+    "ElementIndex",
 ]
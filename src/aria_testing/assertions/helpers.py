@@ -7,9 +7,12 @@ stores query parameters and implements a __call__ method for execution.
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, replace
 from typing import Self
 
+from tdom import Element
+
 from aria_testing.errors import ElementNotFoundError, MultipleElementsError
 from aria_testing.queries import (
     Container,
@@ -59,7 +62,66 @@ Searched in:
 """
 
 
-@dataclass(frozen=True)
+# Fields that fluent methods (text_content, with_attribute) fill in
+_CHECK_FIELDS = ("expected_text", "attribute_name", "attribute_value")
+
+
+def _intern_fields(helper: object, *field_names: str) -> None:
+    """Intern the given string fields of a frozen helper in place.
+
+    Query parameters repeat across thousands of helper instances, so interning
+    them lets the string comparisons inside queries succeed on identity.
+
+    Args:
+        helper: The frozen dataclass instance being initialized
+        field_names: Names of the fields to intern (None values are skipped)
+    """
+    for field_name in field_names:
+        value = getattr(helper, field_name)
+        # sys.intern() only accepts exact str instances
+        if type(value) is str:
+            object.__setattr__(helper, field_name, sys.intern(value))
+
+
+def _check_element(
+    element: Element,
+    query_desc: str,
+    expected_text: str | None,
+    attribute_name: str | None,
+    attribute_value: str | None,
+) -> None:
+    """Run the text content and attribute checks configured on a helper.
+
+    Args:
+        element: The element the query found
+        query_desc: Human-readable description of the query, for error messages
+        expected_text: Expected text content (None skips the check)
+        attribute_name: Attribute that must be present (None skips the check)
+        attribute_value: Expected attribute value (None only checks presence)
+
+    Raises:
+        AssertionError: If the text or attribute does not match
+    """
+    if expected_text is not None:
+        actual_text = get_text_content(element)
+        if actual_text != expected_text:
+            raise AssertionError(
+                f"Expected text: {expected_text!r} but got: {actual_text!r}\n\nQuery: {query_desc}"
+            )
+
+    if attribute_name is not None:
+        actual_value = element.attrs.get(attribute_name)
+        if actual_value is None:
+            raise AssertionError(
+                f"Expected attribute {attribute_name!r} not found\n\nQuery: {query_desc}"
+            )
+        if attribute_value is not None and actual_value != attribute_value:
+            raise AssertionError(
+                f"Expected attribute {attribute_name!r}={attribute_value!r} but got {actual_value!r}\n\nQuery: {query_desc}"
+            )
+
+
+@dataclass(frozen=True, slots=True)
 class GetByRole:
     """Assert element with specific ARIA role exists in container.
 
@@ -79,6 +141,9 @@ class GetByRole:
     attribute_name: str | None = None
     attribute_value: str | None = None
 
+    def __post_init__(self) -> None:
+        _intern_fields(self, "role", "name", *_CHECK_FIELDS)
+
     def __call__(self, container: Container) -> None:
         """Execute assertion, raising AssertionError on failure.
 
@@ -105,28 +170,13 @@ class GetByRole:
                     f"Expected element NOT to exist but found: {element}\n\nQuery: {query_desc}"
                 )
 
-            # Check text content if specified
-            if self.expected_text is not None:
-                actual_text = get_text_content(element)
-                if actual_text != self.expected_text:
-                    raise AssertionError(
-                        f"Expected text: {self.expected_text!r} but got: {actual_text!r}\n\nQuery: {query_desc}"
-                    )
-
-            # Check attribute if specified
-            if self.attribute_name is not None:
-                actual_value = element.attrs.get(self.attribute_name)
-                if actual_value is None:
-                    raise AssertionError(
-                        f"Expected attribute {self.attribute_name!r} not found\n\nQuery: {query_desc}"
-                    )
-                if (
-                    self.attribute_value is not None
-                    and actual_value != self.attribute_value
-                ):
-                    raise AssertionError(
-                        f"Expected attribute {self.attribute_name!r}={self.attribute_value!r} but got {actual_value!r}\n\nQuery: {query_desc}"
-                    )
+            _check_element(
+                element,
+                query_desc,
+                self.expected_text,
+                self.attribute_name,
+                self.attribute_value,
+            )
 
         except (ElementNotFoundError, MultipleElementsError) as e:
             # If .not_() was used, element not found is success
@@ -168,7 +218,7 @@ class GetByRole:
         return replace(self, attribute_name=name, attribute_value=value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GetByText:
     """Assert element with specific text content exists in container.
 
@@ -183,6 +233,9 @@ class GetByText:
     attribute_name: str | None = None
     attribute_value: str | None = None
 
+    def __post_init__(self) -> None:
+        _intern_fields(self, "text", *_CHECK_FIELDS)
+
     def __call__(self, container: Container) -> None:
         """Execute assertion, raising AssertionError on failure."""
         query_desc = f"text={self.text!r}"
@@ -195,26 +248,13 @@ class GetByText:
                     f"Expected element NOT to exist but found: {element}\n\nQuery: {query_desc}"
                 )
 
-            if self.expected_text is not None:
-                actual_text = get_text_content(element)
-                if actual_text != self.expected_text:
-                    raise AssertionError(
-                        f"Expected text: {self.expected_text!r} but got: {actual_text!r}\n\nQuery: {query_desc}"
-                    )
-
-            if self.attribute_name is not None:
-                actual_value = element.attrs.get(self.attribute_name)
-                if actual_value is None:
-                    raise AssertionError(
-                        f"Expected attribute {self.attribute_name!r} not found\n\nQuery: {query_desc}"
-                    )
-                if (
-                    self.attribute_value is not None
-                    and actual_value != self.attribute_value
-                ):
-                    raise AssertionError(
-                        f"Expected attribute {self.attribute_name!r}={self.attribute_value!r} but got {actual_value!r}\n\nQuery: {query_desc}"
-                    )
+            _check_element(
+                element,
+                query_desc,
+                self.expected_text,
+                self.attribute_name,
+                self.attribute_value,
+            )
 
         except (ElementNotFoundError, MultipleElementsError) as e:
             if self.negate:
@@ -236,7 +276,7 @@ class GetByText:
         return replace(self, attribute_name=name, attribute_value=value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GetByLabelText:
     """Assert element with specific label text exists in container.
 
@@ -251,6 +291,9 @@ class GetByLabelText:
     attribute_name: str | None = None
     attribute_value: str | None = None
 
+    def __post_init__(self) -> None:
+        _intern_fields(self, "label", *_CHECK_FIELDS)
+
     def __call__(self, container: Container) -> None:
         """Execute assertion, raising AssertionError on failure."""
         query_desc = f"label={self.label!r}"
@@ -263,26 +306,13 @@ class GetByLabelText:
                     f"Expected element NOT to exist but found: {element}\n\nQuery: {query_desc}"
                 )
 
-            if self.expected_text is not None:
-                actual_text = get_text_content(element)
-                if actual_text != self.expected_text:
-                    raise AssertionError(
-                        f"Expected text: {self.expected_text!r} but got: {actual_text!r}\n\nQuery: {query_desc}"
-                    )
-
-            if self.attribute_name is not None:
-                actual_value = element.attrs.get(self.attribute_name)
-                if actual_value is None:
-                    raise AssertionError(
-                        f"Expected attribute {self.attribute_name!r} not found\n\nQuery: {query_desc}"
-                    )
-                if (
-                    self.attribute_value is not None
-                    and actual_value != self.attribute_value
-                ):
-                    raise AssertionError(
-                        f"Expected attribute {self.attribute_name!r}={self.attribute_value!r} but got {actual_value!r}\n\nQuery: {query_desc}"
-                    )
+            _check_element(
+                element,
+                query_desc,
+                self.expected_text,
+                self.attribute_name,
+                self.attribute_value,
+            )
 
         except (ElementNotFoundError, MultipleElementsError) as e:
             if self.negate:
@@ -304,7 +334,7 @@ class GetByLabelText:
         return replace(self, attribute_name=name, attribute_value=value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GetByTestId:
     """Assert element with specific test ID exists in container.
 
@@ -319,6 +349,9 @@ class GetByTestId:
     attribute_name: str | None = None
     attribute_value: str | None = None
 
+    def __post_init__(self) -> None:
+        _intern_fields(self, "test_id", *_CHECK_FIELDS)
+
     def __call__(self, container: Container) -> None:
         """Execute assertion, raising AssertionError on failure."""
         query_desc = f"test_id={self.test_id!r}"
@@ -331,26 +364,13 @@ class GetByTestId:
                     f"Expected element NOT to exist but found: {element}\n\nQuery: {query_desc}"
                 )
 
-            if self.expected_text is not None:
-                actual_text = get_text_content(element)
-                if actual_text != self.expected_text:
-                    raise AssertionError(
-                        f"Expected text: {self.expected_text!r} but got: {actual_text!r}\n\nQuery: {query_desc}"
-                    )
-
-            if self.attribute_name is not None:
-                actual_value = element.attrs.get(self.attribute_name)
-                if actual_value is None:
-                    raise AssertionError(
-                        f"Expected attribute {self.attribute_name!r} not found\n\nQuery: {query_desc}"
-                    )
-                if (
-                    self.attribute_value is not None
-                    and actual_value != self.attribute_value
-                ):
-                    raise AssertionError(
-                        f"Expected attribute {self.attribute_name!r}={self.attribute_value!r} but got {actual_value!r}\n\nQuery: {query_desc}"
-                    )
+            _check_element(
+                element,
+                query_desc,
+                self.expected_text,
+                self.attribute_name,
+                self.attribute_value,
+            )
 
         except (ElementNotFoundError, MultipleElementsError) as e:
             if self.negate:
@@ -372,7 +392,7 @@ class GetByTestId:
         return replace(self, attribute_name=name, attribute_value=value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GetByClass:
     """Assert element with specific CSS class exists in container.
 
@@ -387,6 +407,9 @@ class GetByClass:
     attribute_name: str | None = None
     attribute_value: str | None = None
 
+    def __post_init__(self) -> None:
+        _intern_fields(self, "class_name", *_CHECK_FIELDS)
+
     def __call__(self, container: Container) -> None:
         """Execute assertion, raising AssertionError on failure."""
         query_desc = f"class_name={self.class_name!r}"
@@ -399,26 +422,13 @@ class GetByClass:
                     f"Expected element NOT to exist but found: {element}\n\nQuery: {query_desc}"
                 )
 
-            if self.expected_text is not None:
-                actual_text = get_text_content(element)
-                if actual_text != self.expected_text:
-                    raise AssertionError(
-                        f"Expected text: {self.expected_text!r} but got: {actual_text!r}\n\nQuery: {query_desc}"
-                    )
-
-            if self.attribute_name is not None:
-                actual_value = element.attrs.get(self.attribute_name)
-                if actual_value is None:
-                    raise AssertionError(
-                        f"Expected attribute {self.attribute_name!r} not found\n\nQuery: {query_desc}"
-                    )
-                if (
-                    self.attribute_value is not None
-                    and actual_value != self.attribute_value
-                ):
-                    raise AssertionError(
-                        f"Expected attribute {self.attribute_name!r}={self.attribute_value!r} but got {actual_value!r}\n\nQuery: {query_desc}"
-                    )
+            _check_element(
+                element,
+                query_desc,
+                self.expected_text,
+                self.attribute_name,
+                self.attribute_value,
+            )
 
         except (ElementNotFoundError, MultipleElementsError) as e:
             if self.negate:
@@ -440,7 +450,7 @@ class GetByClass:
         return replace(self, attribute_name=name, attribute_value=value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GetById:
     """Assert element with specific ID exists in container.
 
@@ -455,6 +465,9 @@ class GetById:
     attribute_name: str | None = None
     attribute_value: str | None = None
 
+    def __post_init__(self) -> None:
+        _intern_fields(self, "id", *_CHECK_FIELDS)
+
     def __call__(self, container: Container) -> None:
         """Execute assertion, raising AssertionError on failure."""
         query_desc = f"id={self.id!r}"
@@ -467,26 +480,13 @@ class GetById:
                     f"Expected element NOT to exist but found: {element}\n\nQuery: {query_desc}"
                 )
 
-            if self.expected_text is not None:
-                actual_text = get_text_content(element)
-                if actual_text != self.expected_text:
-                    raise AssertionError(
-                        f"Expected text: {self.expected_text!r} but got: {actual_text!r}\n\nQuery: {query_desc}"
-                    )
-
-            if self.attribute_name is not None:
-                actual_value = element.attrs.get(self.attribute_name)
-                if actual_value is None:
-                    raise AssertionError(
-                        f"Expected attribute {self.attribute_name!r} not found\n\nQuery: {query_desc}"
-                    )
-                if (
-                    self.attribute_value is not None
-                    and actual_value != self.attribute_value
-                ):
-                    raise AssertionError(
-                        f"Expected attribute {self.attribute_name!r}={self.attribute_value!r} but got {actual_value!r}\n\nQuery: {query_desc}"
-                    )
+            _check_element(
+                element,
+                query_desc,
+                self.expected_text,
+                self.attribute_name,
+                self.attribute_value,
+            )
 
         except (ElementNotFoundError, MultipleElementsError) as e:
             if self.negate:
@@ -508,7 +508,7 @@ class GetById:
         return replace(self, attribute_name=name, attribute_value=value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GetByTagName:
     """Assert element with specific HTML tag exists in container.
 
@@ -523,6 +523,9 @@ class GetByTagName:
     attribute_name: str | None = None
     attribute_value: str | None = None
 
+    def __post_init__(self) -> None:
+        _intern_fields(self, "tag_name", *_CHECK_FIELDS)
+
     def __call__(self, container: Container) -> None:
         """Execute assertion, raising AssertionError on failure."""
         query_desc = f"tag_name={self.tag_name!r}"
@@ -535,26 +538,13 @@ class GetByTagName:
                     f"Expected element NOT to exist but found: {element}\n\nQuery: {query_desc}"
                 )
 
-            if self.expected_text is not None:
-                actual_text = get_text_content(element)
-                if actual_text != self.expected_text:
-                    raise AssertionError(
-                        f"Expected text: {self.expected_text!r} but got: {actual_text!r}\n\nQuery: {query_desc}"
-                    )
-
-            if self.attribute_name is not None:
-                actual_value = element.attrs.get(self.attribute_name)
-                if actual_value is None:
-                    raise AssertionError(
-                        f"Expected attribute {self.attribute_name!r} not found\n\nQuery: {query_desc}"
-                    )
-                if (
-                    self.attribute_value is not None
-                    and actual_value != self.attribute_value
-                ):
-                    raise AssertionError(
-                        f"Expected attribute {self.attribute_name!r}={self.attribute_value!r} but got {actual_value!r}\n\nQuery: {query_desc}"
-                    )
+            _check_element(
+                element,
+                query_desc,
+                self.expected_text,
+                self.attribute_name,
+                self.attribute_value,
+            )
 
         except (ElementNotFoundError, MultipleElementsError) as e:
             if self.negate:
@@ -579,7 +569,7 @@ class GetByTagName:
 # List-Oriented Query Helpers (GetAllBy*)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GetAllByRole:
     """Assert multiple elements with specific ARIA role exist in container.
 
@@ -598,6 +588,9 @@ class GetAllByRole:
     attribute_name: str | None = None
     attribute_value: str | None = None
 
+    def __post_init__(self) -> None:
+        _intern_fields(self, "role", "name", *_CHECK_FIELDS)
+
     def __call__(self, container: Container) -> None:
         """Execute assertion, raising AssertionError on failure.
 
@@ -634,28 +627,13 @@ class GetAllByRole:
                     )
                 element = elements[self.nth_index]
 
-                # Check text content if specified
-                if self.expected_text is not None:
-                    actual_text = get_text_content(element)
-                    if actual_text != self.expected_text:
-                        raise AssertionError(
-                            f"Expected text: {self.expected_text!r} but got: {actual_text!r}\n\nQuery: {query_desc}, nth={self.nth_index}"
-                        )
-
-                # Check attribute if specified
-                if self.attribute_name is not None:
-                    actual_value = element.attrs.get(self.attribute_name)
-                    if actual_value is None:
-                        raise AssertionError(
-                            f"Expected attribute {self.attribute_name!r} not found\n\nQuery: {query_desc}, nth={self.nth_index}"
-                        )
-                    if (
-                        self.attribute_value is not None
-                        and actual_value != self.attribute_value
-                    ):
-                        raise AssertionError(
-                            f"Expected attribute {self.attribute_name!r}={self.attribute_value!r} but got {actual_value!r}\n\nQuery: {query_desc}, nth={self.nth_index}"
-                        )
+                _check_element(
+                    element,
+                    f"{query_desc}, nth={self.nth_index}",
+                    self.expected_text,
+                    self.attribute_name,
+                    self.attribute_value,
+                )
 
         except (ElementNotFoundError, MultipleElementsError) as e:
             error_msg = _format_error_message(e, container, query_desc)
@@ -707,7 +685,7 @@ class GetAllByRole:
         return replace(self, attribute_name=name, attribute_value=value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GetAllByText:
     """Assert multiple elements with specific text content exist in container.
 
@@ -724,6 +702,9 @@ class GetAllByText:
     attribute_name: str | None = None
     attribute_value: str | None = None
 
+    def __post_init__(self) -> None:
+        _intern_fields(self, "text", *_CHECK_FIELDS)
+
     def __call__(self, container: Container) -> None:
         """Execute assertion, raising AssertionError on failure."""
         query_desc = f"text={self.text!r}"
@@ -745,26 +726,13 @@ class GetAllByText:
                     )
                 element = elements[self.nth_index]
 
-                if self.expected_text is not None:
-                    actual_text = get_text_content(element)
-                    if actual_text != self.expected_text:
-                        raise AssertionError(
-                            f"Expected text: {self.expected_text!r} but got: {actual_text!r}\n\nQuery: {query_desc}, nth={self.nth_index}"
-                        )
-
-                if self.attribute_name is not None:
-                    actual_value = element.attrs.get(self.attribute_name)
-                    if actual_value is None:
-                        raise AssertionError(
-                            f"Expected attribute {self.attribute_name!r} not found\n\nQuery: {query_desc}, nth={self.nth_index}"
-                        )
-                    if (
-                        self.attribute_value is not None
-                        and actual_value != self.attribute_value
-                    ):
-                        raise AssertionError(
-                            f"Expected attribute {self.attribute_name!r}={self.attribute_value!r} but got {actual_value!r}\n\nQuery: {query_desc}, nth={self.nth_index}"
-                        )
+                _check_element(
+                    element,
+                    f"{query_desc}, nth={self.nth_index}",
+                    self.expected_text,
+                    self.attribute_name,
+                    self.attribute_value,
+                )
 
         except (ElementNotFoundError, MultipleElementsError) as e:
             error_msg = _format_error_message(e, container, query_desc)
@@ -787,7 +755,7 @@ class GetAllByText:
         return replace(self, attribute_name=name, attribute_value=value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GetAllByLabelText:
     """Assert multiple elements with specific label text exist in container.
 
@@ -804,6 +772,9 @@ class GetAllByLabelText:
     attribute_name: str | None = None
     attribute_value: str | None = None
 
+    def __post_init__(self) -> None:
+        _intern_fields(self, "label", *_CHECK_FIELDS)
+
     def __call__(self, container: Container) -> None:
         """Execute assertion, raising AssertionError on failure."""
         query_desc = f"label={self.label!r}"
@@ -825,26 +796,13 @@ class GetAllByLabelText:
                     )
                 element = elements[self.nth_index]
 
-                if self.expected_text is not None:
-                    actual_text = get_text_content(element)
-                    if actual_text != self.expected_text:
-                        raise AssertionError(
-                            f"Expected text: {self.expected_text!r} but got: {actual_text!r}\n\nQuery: {query_desc}, nth={self.nth_index}"
-                        )
-
-                if self.attribute_name is not None:
-                    actual_value = element.attrs.get(self.attribute_name)
-                    if actual_value is None:
-                        raise AssertionError(
-                            f"Expected attribute {self.attribute_name!r} not found\n\nQuery: {query_desc}, nth={self.nth_index}"
-                        )
-                    if (
-                        self.attribute_value is not None
-                        and actual_value != self.attribute_value
-                    ):
-                        raise AssertionError(
-                            f"Expected attribute {self.attribute_name!r}={self.attribute_value!r} but got {actual_value!r}\n\nQuery: {query_desc}, nth={self.nth_index}"
-                        )
+                _check_element(
+                    element,
+                    f"{query_desc}, nth={self.nth_index}",
+                    self.expected_text,
+                    self.attribute_name,
+                    self.attribute_value,
+                )
 
         except (ElementNotFoundError, MultipleElementsError) as e:
             error_msg = _format_error_message(e, container, query_desc)
@@ -867,7 +825,7 @@ class GetAllByLabelText:
         return replace(self, attribute_name=name, attribute_value=value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GetAllByTestId:
     """Assert multiple elements with specific test ID exist in container.
 
@@ -884,6 +842,9 @@ class GetAllByTestId:
     attribute_name: str | None = None
     attribute_value: str | None = None
 
+    def __post_init__(self) -> None:
+        _intern_fields(self, "test_id", *_CHECK_FIELDS)
+
     def __call__(self, container: Container) -> None:
         """Execute assertion, raising AssertionError on failure."""
         query_desc = f"test_id={self.test_id!r}"
@@ -905,26 +866,13 @@ class GetAllByTestId:
                     )
                 element = elements[self.nth_index]
 
-                if self.expected_text is not None:
-                    actual_text = get_text_content(element)
-                    if actual_text != self.expected_text:
-                        raise AssertionError(
-                            f"Expected text: {self.expected_text!r} but got: {actual_text!r}\n\nQuery: {query_desc}, nth={self.nth_index}"
-                        )
-
-                if self.attribute_name is not None:
-                    actual_value = element.attrs.get(self.attribute_name)
-                    if actual_value is None:
-                        raise AssertionError(
-                            f"Expected attribute {self.attribute_name!r} not found\n\nQuery: {query_desc}, nth={self.nth_index}"
-                        )
-                    if (
-                        self.attribute_value is not None
-                        and actual_value != self.attribute_value
-                    ):
-                        raise AssertionError(
-                            f"Expected attribute {self.attribute_name!r}={self.attribute_value!r} but got {actual_value!r}\n\nQuery: {query_desc}, nth={self.nth_index}"
-                        )
+                _check_element(
+                    element,
+                    f"{query_desc}, nth={self.nth_index}",
+                    self.expected_text,
+                    self.attribute_name,
+                    self.attribute_value,
+                )
 
         except (ElementNotFoundError, MultipleElementsError) as e:
             error_msg = _format_error_message(e, container, query_desc)
@@ -947,7 +895,7 @@ class GetAllByTestId:
         return replace(self, attribute_name=name, attribute_value=value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GetAllByClass:
     """Assert multiple elements with specific CSS class exist in container.
 
@@ -964,6 +912,9 @@ class GetAllByClass:
     attribute_name: str | None = None
     attribute_value: str | None = None
 
+    def __post_init__(self) -> None:
+        _intern_fields(self, "class_name", *_CHECK_FIELDS)
+
     def __call__(self, container: Container) -> None:
         """Execute assertion, raising AssertionError on failure."""
         query_desc = f"class_name={self.class_name!r}"
@@ -985,26 +936,13 @@ class GetAllByClass:
                     )
                 element = elements[self.nth_index]
 
-                if self.expected_text is not None:
-                    actual_text = get_text_content(element)
-                    if actual_text != self.expected_text:
-                        raise AssertionError(
-                            f"Expected text: {self.expected_text!r} but got: {actual_text!r}\n\nQuery: {query_desc}, nth={self.nth_index}"
-                        )
-
-                if self.attribute_name is not None:
-                    actual_value = element.attrs.get(self.attribute_name)
-                    if actual_value is None:
-                        raise AssertionError(
-                            f"Expected attribute {self.attribute_name!r} not found\n\nQuery: {query_desc}, nth={self.nth_index}"
-                        )
-                    if (
-                        self.attribute_value is not None
-                        and actual_value != self.attribute_value
-                    ):
-                        raise AssertionError(
-                            f"Expected attribute {self.attribute_name!r}={self.attribute_value!r} but got {actual_value!r}\n\nQuery: {query_desc}, nth={self.nth_index}"
-                        )
+                _check_element(
+                    element,
+                    f"{query_desc}, nth={self.nth_index}",
+                    self.expected_text,
+                    self.attribute_name,
+                    self.attribute_value,
+                )
 
         except (ElementNotFoundError, MultipleElementsError) as e:
             error_msg = _format_error_message(e, container, query_desc)
@@ -1027,7 +965,7 @@ class GetAllByClass:
         return replace(self, attribute_name=name, attribute_value=value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GetAllByTagName:
     """Assert multiple elements with specific HTML tag exist in container.
 
@@ -1044,6 +982,9 @@ class GetAllByTagName:
     attribute_name: str | None = None
     attribute_value: str | None = None
 
+    def __post_init__(self) -> None:
+        _intern_fields(self, "tag_name", *_CHECK_FIELDS)
+
     def __call__(self, container: Container) -> None:
         """Execute assertion, raising AssertionError on failure."""
         query_desc = f"tag_name={self.tag_name!r}"
@@ -1065,26 +1006,13 @@ class GetAllByTagName:
                     )
                 element = elements[self.nth_index]
 
-                if self.expected_text is not None:
-                    actual_text = get_text_content(element)
-                    if actual_text != self.expected_text:
-                        raise AssertionError(
-                            f"Expected text: {self.expected_text!r} but got: {actual_text!r}\n\nQuery: {query_desc}, nth={self.nth_index}"
-                        )
-
-                if self.attribute_name is not None:
-                    actual_value = element.attrs.get(self.attribute_name)
-                    if actual_value is None:
-                        raise AssertionError(
-                            f"Expected attribute {self.attribute_name!r} not found\n\nQuery: {query_desc}, nth={self.nth_index}"
-                        )
-                    if (
-                        self.attribute_value is not None
-                        and actual_value != self.attribute_value
-                    ):
-                        raise AssertionError(
-                            f"Expected attribute {self.attribute_name!r}={self.attribute_value!r} but got {actual_value!r}\n\nQuery: {query_desc}, nth={self.nth_index}"
-                        )
+                _check_element(
+                    element,
+                    f"{query_desc}, nth={self.nth_index}",
+                    self.expected_text,
+                    self.attribute_name,
+                    self.attribute_value,
+                )
 
         except (ElementNotFoundError, MultipleElementsError) as e:
             error_msg = _format_error_message(e, container, query_desc)
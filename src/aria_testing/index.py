@@ -0,0 +1,131 @@
+"""
+Immutable element indexes for containers that are queried repeatedly.
+
+Every query walks the container's tree. When a test runs many queries against
+the same container, build_index() walks it once and returns an ElementIndex
+that all query functions accept in place of the container.
+
+An ElementIndex is built only from tuples and read-only mappings, so it can be
+shared between threads without locking. It is a snapshot: rebuild it after
+mutating the tree.
+"""
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+
+from tdom import Element, Node
+
+from aria_testing.utils import (
+    _casefold_tag,
+    _intern,
+    get_accessible_name,
+    get_all_elements,
+)
+
+
+@dataclass(frozen=True, slots=True, repr=False)
+class ElementIndex:
+    """
+    Precomputed lookup tables for the elements of a container.
+
+    Attributes:
+        root: The container the index was built from
+        elements: All elements in document order, including root if it is an Element
+        descendants: Elements below root, which role/text/class/label queries search
+        by_tag: Casefolded tag name to elements with that tag
+        by_attr: Attribute name to elements that have the attribute
+        by_id: id attribute value to elements with that id
+        by_class: Class token to descendants whose class attribute contains it
+        by_role: ARIA role to descendants with that role
+        names: id() of each descendant that has a role to its accessible name
+    """
+
+    root: Node
+    elements: tuple[Element, ...]
+    descendants: tuple[Element, ...]
+    by_tag: Mapping[str, tuple[Element, ...]]
+    by_attr: Mapping[str, tuple[Element, ...]]
+    by_id: Mapping[str, tuple[Element, ...]]
+    by_class: Mapping[str, tuple[Element, ...]]
+    by_role: Mapping[str, tuple[Element, ...]]
+    names: Mapping[int, str]
+
+    def __str__(self) -> str:
+        return str(self.root)
+
+    def __repr__(self) -> str:
+        root_type = type(self.root).__name__
+        return f"ElementIndex(root=<{root_type}>, elements={len(self.elements)})"
+
+
+def _freeze(
+    groups: dict[str, list[Element]],
+) -> Mapping[str, tuple[Element, ...]]:
+    """Convert grouped element lists into a read-only mapping of tuples."""
+    return MappingProxyType({key: tuple(items) for key, items in groups.items()})
+
+
+def build_index(container: Node) -> ElementIndex:
+    """
+    Walk a container once and build an ElementIndex for it.
+
+    Args:
+        container: The Element, Fragment, or Node to index
+
+    Returns:
+        An immutable ElementIndex that query functions accept as a container
+
+    Example:
+        index = build_index(html(t"<nav><a href='/'>Home</a></nav>"))
+        get_by_role(index, "navigation")
+        get_all_by_role(index, "link")
+    """
+    # Local import: queries accept ElementIndex, so it imports this module
+    from aria_testing.queries import get_role_for_element
+
+    elements = tuple(get_all_elements(container))
+    by_tag: dict[str, list[Element]] = {}
+    by_attr: dict[str, list[Element]] = {}
+    by_id: dict[str, list[Element]] = {}
+    by_class: dict[str, list[Element]] = {}
+    by_role: dict[str, list[Element]] = {}
+    names: dict[int, str] = {}
+
+    for element in elements:
+        by_tag.setdefault(_casefold_tag(element.tag), []).append(element)
+        for name in element.attrs:
+            by_attr.setdefault(_intern(name), []).append(element)
+        element_id = element.attrs.get("id")
+        if isinstance(element_id, str):
+            by_id.setdefault(_intern(element_id), []).append(element)
+
+    # The root is always first in document order, so skipping it is a slice
+    descendants = elements[1:] if isinstance(container, Element) else elements
+
+    # Class and role queries search descendants only, and role queries only
+    # ever ask for the names of elements that have a role
+    for element in descendants:
+        cls = element.attrs.get("class")
+        if isinstance(cls, str):
+            # dict.fromkeys drops repeated tokens while keeping their order
+            for token in dict.fromkeys(cls.split()):
+                by_class.setdefault(_intern(token), []).append(element)
+        role = get_role_for_element(element)
+        if role is not None:
+            by_role.setdefault(_intern(role), []).append(element)
+            # id() keys stay valid because the index holds the elements
+            # themselves, so none can be freed and its id reused
+            names[id(element)] = get_accessible_name(element, role)
+
+    return ElementIndex(
+        root=container,
+        elements=elements,
+        descendants=descendants,
+        by_tag=_freeze(by_tag),
+        by_attr=_freeze(by_attr),
+        by_id=_freeze(by_id),
+        by_class=_freeze(by_class),
+        by_role=_freeze(by_role),
+        names=MappingProxyType(names),
+    )
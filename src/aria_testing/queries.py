@@ -7,22 +7,93 @@ search within any tdom structure returned by html().
 
 import re
 import sys
+from collections.abc import Sequence
+from functools import lru_cache
+from itertools import islice
 from types import MappingProxyType
-from typing import Callable, Literal
+from typing import Any, Callable, Literal
 
 from tdom import Element, Fragment, Node
 
 from aria_testing.errors import ElementNotFoundError, MultipleElementsError
+from aria_testing.index import ElementIndex
 from aria_testing.utils import (
+    _casefold_tag,
+    _text_contents,
+    _traverse_containing_text,
+    _traverse_elements,
     find_elements_by_attribute,
+    find_elements_by_tag,
     get_accessible_name,
     get_all_elements,
     get_text_content,
 )
 
 # Type alias for containers that can be searched
-# Accepts both Element, Fragment, and Node as valid containers
-Container = Element | Fragment | Node
+# Accepts Element, Fragment, and Node, or a prebuilt ElementIndex of one
+Container = Element | Fragment | Node | ElementIndex
+
+
+def _searchable_elements(container: Container) -> Sequence[Element]:
+    """Return the elements below the container, in document order.
+
+    An Element container is not part of its own results. An ElementIndex
+    already holds this list, so no traversal happens.
+    """
+    if isinstance(container, ElementIndex):
+        return container.descendants
+    return get_all_elements(container, skip_root=isinstance(container, Element))
+
+
+def _elements_with_attribute(
+    container: Container,
+    attribute: str,
+    value: str,
+    *,
+    _max_results: int | None = None,
+) -> list[Element]:
+    """Return elements (including an Element container) where attribute == value."""
+    if isinstance(container, ElementIndex):
+        if attribute == "id":
+            return list(container.by_id.get(value, ())[:_max_results])
+        matches = (
+            el
+            for el in container.by_attr.get(attribute, ())
+            if el.attrs[attribute] == value
+        )
+        return list(islice(matches, _max_results))
+    return find_elements_by_attribute(
+        container, attribute, value, max_results=_max_results
+    )
+
+
+def _get_unique_by_attribute(
+    container: Container, attribute: str, value: str, message: str
+) -> list[Element]:
+    """
+    Find the elements with attribute == value, stopping once a duplicate is seen.
+
+    A unique match needs at most two elements to decide. Only the error path
+    walks the whole container, so MultipleElementsError reports the true count.
+
+    Args:
+        container: The container to search within
+        attribute: The attribute name to check
+        value: The attribute value to match
+        message: MultipleElementsError message used if value is not unique
+
+    Returns:
+        The matching elements, at most one of them
+
+    Raises:
+        MultipleElementsError: If more than one element matches
+    """
+    elements = _elements_with_attribute(container, attribute, value, _max_results=2)
+    if len(elements) > 1:
+        count = len(_elements_with_attribute(container, attribute, value))
+        raise MultipleElementsError(message, count=count)
+    return elements
+
 
 # ARIA Role Type Definition
 # Based on WAI-ARIA 1.1 specification and HTML living standard
@@ -208,9 +279,10 @@ def _make_query_variants(
             return None
         if len(elements) > 1:
             value_str = str(args[1]) if len(args) > 1 else "..."
+            # Only the error path walks everything, to report the true count
             raise MultipleElementsError(
                 _MULTIPLE_MSG.format(query_type=query_type, value=value_str),
-                count=len(elements),
+                count=len(query_all_func(*args, **kwargs)),
             )
         return elements[0]
 
@@ -227,9 +299,10 @@ def _make_query_variants(
             )
         if len(elements) > 1:
             value_str = str(args[1]) if len(args) > 1 else "..."
+            # Only the error path walks everything, to report the true count
             raise MultipleElementsError(
                 _MULTIPLE_MSG.format(query_type=query_type, value=value_str),
-                count=len(elements),
+                count=len(query_all_func(*args, **kwargs)),
             )
         return elements[0]
 
@@ -281,6 +354,10 @@ _ROLE_MAP = MappingProxyType(
     }
 )
 
+# Distinguishes a missing attribute from one present without a value (None),
+# so a single dict.get() replaces an `in` test plus a subscript
+_MISSING: Any = object()
+
 _INPUT_TYPE_MAP = MappingProxyType(
     {
         sys.intern("text"): sys.intern("textbox"),
@@ -296,6 +373,50 @@ _INPUT_TYPE_MAP = MappingProxyType(
 )
 
 
+def _group_tags_by_role() -> MappingProxyType[str, frozenset[str]]:
+    """Invert the role tables into the set of tags that can imply each role."""
+    groups: dict[str, set[str]] = {}
+    for tag, role in _ROLE_MAP.items():
+        groups.setdefault(role, set()).add(tag)
+    # Any input type outside _INPUT_TYPE_MAP falls back to textbox
+    for role in {*_INPUT_TYPE_MAP.values(), sys.intern("textbox")}:
+        groups.setdefault(role, set()).add(sys.intern("input"))
+    return MappingProxyType({role: frozenset(tags) for role, tags in groups.items()})
+
+
+# Casefolded tags whose implicit role can be the key role
+_ROLE_TAGS = _group_tags_by_role()
+
+
+@lru_cache(maxsize=1024)
+def _implicit_role(tag: str, type_attr: str | None) -> str | None:
+    """
+    Compute the implicit ARIA role for an element shape.
+
+    The implicit role depends only on the tag name and the type attribute,
+    and documents repeat a handful of shapes, so results are memoized.
+
+    Args:
+        tag: The element's tag name as written
+        type_attr: The element's type attribute, if any
+
+    Returns:
+        The interned implicit role, or None if the element has none
+    """
+    # Casefolded tags are memoized and interned
+    tag = _casefold_tag(tag)
+
+    if tag in _ROLE_MAP:
+        return _ROLE_MAP[tag]
+
+    # Special handling for input elements
+    if tag == sys.intern("input"):
+        input_type = sys.intern((type_attr or "text").casefold())
+        return _INPUT_TYPE_MAP.get(input_type, sys.intern("textbox"))
+
+    return None
+
+
 def get_role_for_element(node: Node) -> str | None:
     """
     Get the ARIA role for a node (only Elements can have roles).
@@ -306,22 +427,55 @@ def get_role_for_element(node: Node) -> str | None:
 
     element = node
 
-    # Check explicit role
-    if "role" in element.attrs:
-        return element.attrs["role"]
+    # Check explicit role (a bare role attribute still overrides the implicit one)
+    explicit_role = element.attrs.get("role", _MISSING)
+    if explicit_role is not _MISSING:
+        return explicit_role
 
-    # Check implicit roles - use casefold() for better performance and Unicode handling
-    tag = sys.intern(element.tag.casefold())
+    return _implicit_role(element.tag, element.attrs.get("type"))
 
-    if tag in _ROLE_MAP:
-        return _ROLE_MAP[tag]
 
-    # Special handling for input elements
-    if tag == sys.intern("input"):
-        input_type = sys.intern((element.attrs.get("type") or "text").casefold())
-        return _INPUT_TYPE_MAP.get(input_type, sys.intern("textbox"))
+@lru_cache(maxsize=256)
+def _role_matcher(role: str) -> Callable[[Element], bool]:
+    """
+    Return a predicate that tests whether an element has the given role.
 
-    return None
+    Args:
+        role: The ARIA role to match
+
+    Returns:
+        A function of one element, memoized per role
+    """
+    # Most elements have no role-carrying tag, so a set probe rejects them
+    # before the type attribute is read or the implicit role computed
+    tags = _ROLE_TAGS.get(role, frozenset())
+
+    def has_role(element: Element) -> bool:
+        explicit_role = element.attrs.get("role", _MISSING)
+        if explicit_role is not _MISSING:
+            return explicit_role == role
+        if _casefold_tag(element.tag) not in tags:
+            return False
+        return _implicit_role(element.tag, element.attrs.get("type")) == role
+
+    return has_role
+
+
+def _substring_matcher(text: str) -> Callable[[str], bool]:
+    """
+    Return a predicate that tests whether a string contains text.
+
+    Args:
+        text: The substring to look for
+
+    Returns:
+        A function of one string
+    """
+
+    def contains(value: str) -> bool:
+        return text in value
+
+    return contains
 
 
 def query_all_by_role(
@@ -344,58 +498,82 @@ def query_all_by_role(
     Returns:
         List of elements matching the criteria
     """
-    # Skip container element itself if container is an Element
-    skip_container = isinstance(container, Element)
+    skip_root = isinstance(container, Element)
+
+    # Roles from _ROLE_MAP are interned, so an interned argument lets most
+    # comparisons succeed on identity (str subclasses cannot be interned)
+    if type(role) is str:
+        role = sys.intern(role)
+
+    # Role-only tree queries are the common case; their predicate depends on
+    # the role alone and is shared between calls
+    if level is None and name is None and not isinstance(container, ElementIndex):
+        return _traverse_elements(
+            container,
+            _role_matcher(role),
+            skip_root=skip_root,
+            max_results=_max_results,
+        )
 
-    # For role+name queries, we can't use max_results in get_all_elements
-    # because we need to filter by name after getting role matches
-    if name is not None:
-        elements = get_all_elements(container, skip_root=skip_container)
+    # An index carries accessible names computed when it was built
+    names = container.names if isinstance(container, ElementIndex) else None
+    has_role = _role_matcher(role)
+
+    # Decide how names are matched once, rather than once per candidate
+    name_matches: Callable[[str], object] | None
+    if name is None:
+        name_matches = None
+    elif isinstance(name, re.Pattern):
+        name_matches = name.search
     else:
-        # Use early exit for role-only queries
-        elements = get_all_elements(
-            container, skip_root=skip_container, max_results=_max_results
-        )
+        name_matches = _substring_matcher(name)
 
-    results = []
-    for element in elements:
-        element_role = get_role_for_element(element)
-        if element_role != role:
-            continue
+    def matches(element: Element) -> bool:
+        # Candidates from an index are already grouped by role
+        if names is None and not has_role(element):
+            return False
 
         # Check heading level
         if level is not None and role == "heading":
-            if element.tag.casefold() == f"h{level}":
+            if _casefold_tag(element.tag) == f"h{level}":
                 pass  # Match
-            elif "aria-level" in element.attrs:
+            elif (
+                aria_level_str := element.attrs.get("aria-level", _MISSING)
+            ) is not _MISSING:
                 try:
-                    aria_level_str = element.attrs["aria-level"]
                     if aria_level_str and int(aria_level_str) != level:
-                        continue
+                        return False
                 except ValueError:
-                    continue
+                    return False
             else:
-                continue
+                return False
 
         # Check accessible name (lazy evaluation - only if needed)
-        if name is not None:
-            element_name = get_accessible_name(element, element_role)
-            if isinstance(name, re.Pattern):
-                # Regex pattern matching
-                if not name.search(element_name):
-                    continue
+        if name_matches is not None:
+            if names is not None:
+                element_name = names[id(element)]
             else:
-                # String substring matching
-                if name not in element_name:
-                    continue
-
-        results.append(element)
-
-        # Early exit if we've found enough results
-        if _max_results is not None and len(results) >= _max_results:
-            return results
+                element_name = get_accessible_name(element, role)
+            # Regex search or substring test, chosen above
+            return bool(name_matches(element_name))
+
+        return True
+
+    if isinstance(container, ElementIndex):
+        results = []
+        for element in container.by_role.get(role, ()):
+            if matches(element):
+                results.append(element)
+                # Early exit if we've found enough results
+                if _max_results is not None and len(results) >= _max_results:
+                    break
+        return results
 
-    return results
+    # Every criterion is checked during the walk, so the walk itself stops
+    # once enough elements match (rather than after visiting N elements)
+    return _traverse_elements(
+        container, matches, skip_root=skip_root, max_results=_max_results
+    )
 
 
 def get_by_role(
@@ -420,12 +598,17 @@ def get_by_role(
         ElementNotFoundError: If no element found
         MultipleElementsError: If multiple elements found
     """
-    elements = query_all_by_role(container, role, level=level, name=name)
+    # Two matches are enough to tell "one" from "many"
+    elements = query_all_by_role(
+        container, role, level=level, name=name, _max_results=2
+    )
     if not elements:
         raise ElementNotFoundError(f"Unable to find element with role '{role}'")
     if len(elements) > 1:
+        # Only the error path walks everything, to report the true count
+        count = len(query_all_by_role(container, role, level=level, name=name))
         raise MultipleElementsError(
-            f"Found multiple elements with role '{role}'", count=len(elements)
+            f"Found multiple elements with role '{role}'", count=count
         )
     return elements[0]
 
@@ -448,7 +631,9 @@ def query_by_role(
     Returns:
         Single element if found, None otherwise
     """
-    elements = query_all_by_role(container, role, level=level, name=name)
+    elements = query_all_by_role(
+        container, role, level=level, name=name, _max_results=1
+    )
     return elements[0] if elements else None
 
 
@@ -483,19 +668,16 @@ def query_all_by_text(
     container: Container, text: str, *, _max_results: int | None = None
 ) -> list[Element]:
     """Find all elements containing the specified text."""
-    # Skip container element itself if container is an Element
-    skip_container = isinstance(container, Element)
-    elements = get_all_elements(container, skip_root=skip_container)
-
-    results = []
-    for element in elements:
-        element_text = get_text_content(element)
-        if text in element_text:
-            results.append(element)
-            # Early exit if we've found enough
-            if _max_results is not None and len(results) >= _max_results:
-                return results
-    return results
+    # Pruning needs the tree shape, so an index is searched through its root
+    if isinstance(container, ElementIndex):
+        container = container.root
+
+    return _traverse_containing_text(
+        container,
+        text,
+        skip_root=isinstance(container, Element),
+        max_results=_max_results,
+    )
 
 
 # Generate query variants using factory
@@ -519,7 +701,7 @@ def query_all_by_test_id(
     Returns:
         List of matching elements
     """
-    return find_elements_by_attribute(container, attribute, test_id)
+    return _elements_with_attribute(container, attribute, test_id)
 
 
 def query_by_test_id(
@@ -536,7 +718,7 @@ def query_by_test_id(
     Returns:
         The matching element, or None if not found
     """
-    elements = query_all_by_test_id(container, test_id, attribute=attribute)
+    elements = _elements_with_attribute(container, attribute, test_id, _max_results=1)
     return elements[0] if elements else None
 
 
@@ -559,7 +741,12 @@ def get_by_test_id(
         ElementNotFoundError: If no matching element is found
         MultipleElementsError: If multiple elements match
     """
-    elements = query_all_by_test_id(container, test_id, attribute=attribute)
+    elements = _get_unique_by_attribute(
+        container,
+        attribute,
+        test_id,
+        f"Found multiple elements with {attribute}: {test_id}",
+    )
 
     if not elements:
         raise ElementNotFoundError(
@@ -567,11 +754,6 @@ def get_by_test_id(
             suggestion="Check that the test ID is correct and the element exists",
         )
 
-    if len(elements) > 1:
-        raise MultipleElementsError(
-            f"Found multiple elements with {attribute}: {test_id}", count=len(elements)
-        )
-
     return elements[0]
 
 
@@ -618,7 +800,7 @@ def query_by_id(container: Container, element_id: str) -> Element | None:
     Returns:
         The matching element, or None if not found
     """
-    elements = find_elements_by_attribute(container, "id", element_id)
+    elements = _elements_with_attribute(container, "id", element_id, _max_results=1)
     return elements[0] if elements else None
 
 
@@ -638,7 +820,9 @@ def get_by_id(container: Container, element_id: str) -> Element:
         ElementNotFoundError: If no matching element is found
         MultipleElementsError: If multiple elements match (duplicate ids)
     """
-    elements = find_elements_by_attribute(container, "id", element_id)
+    elements = _get_unique_by_attribute(
+        container, "id", element_id, f"Found multiple elements with id: {element_id}"
+    )
 
     if not elements:
         raise ElementNotFoundError(
@@ -646,11 +830,6 @@ def get_by_id(container: Container, element_id: str) -> Element:
             suggestion="Check that the id is correct and the element exists",
         )
 
-    if len(elements) > 1:
-        raise MultipleElementsError(
-            f"Found multiple elements with id: {element_id}", count=len(elements)
-        )
-
     return elements[0]
 
 
@@ -664,23 +843,22 @@ def _elements_with_class(
 
     HTML class attributes are a space-separated list of tokens. This matches
     by token equality, not substring.
-
-    Uses set for O(1) lookup when checking class membership.
     """
-    # Skip container element itself if container is an Element
-    skip_container = isinstance(container, Element)
-    results = []
-    for el in get_all_elements(container, skip_root=skip_container):
-        cls = el.attrs.get("class")
-        if isinstance(cls, str):
-            # Convert to set for O(1) lookup instead of O(n) list membership
-            class_tokens = set(cls.split())
-            if class_name in class_tokens:
-                results.append(el)
-                # Early exit if we've found enough
-                if _max_results is not None and len(results) >= _max_results:
-                    return results
-    return results
+    if isinstance(container, ElementIndex):
+        return list(container.by_class.get(class_name, ())[:_max_results])
+
+    def has_class(element: Element) -> bool:
+        cls = element.attrs.get("class")
+        # A token can only match if it occurs as a substring, and the
+        # substring scan is far cheaper than splitting every class attribute
+        return isinstance(cls, str) and class_name in cls and class_name in cls.split()
+
+    return _traverse_elements(
+        container,
+        has_class,
+        skip_root=isinstance(container, Element),
+        max_results=_max_results,
+    )
 
 
 def query_all_by_class(
@@ -700,24 +878,24 @@ _, query_by_class, get_by_class, get_all_by_class = _make_query_variants(
 
 
 # Helper function for finding form controls (moved to module level for performance)
-def _find_form_controls(element: Element) -> list[Element]:
-    """Find all form control descendants of an element."""
-    results = []
+_FORM_CONTROL_TAGS = frozenset(
+    sys.intern(tag) for tag in ("input", "textarea", "select", "button")
+)
 
-    def traverse(node):
-        if isinstance(node, Element):
-            if node.tag.casefold() in {"input", "textarea", "select", "button"}:
-                results.append(node)
-            if hasattr(node, "children"):
-                for child in node.children:
-                    traverse(child)
 
-    traverse(element)
-    return results
+def _is_form_control(element: Element) -> bool:
+    return _casefold_tag(element.tag) in _FORM_CONTROL_TAGS
+
+
+def _find_form_controls(element: Element) -> list[Element]:
+    """Find all form control descendants of an element."""
+    # Shares the iterative walker, so deeply nested labels cannot hit the
+    # recursion limit
+    return _traverse_elements(element, _is_form_control)
 
 
 # Label text search strategies (extracted for clarity)
-def _find_by_aria_label(elements: list[Element], text: str) -> list[Element]:
+def _find_by_aria_label(elements: Sequence[Element], text: str) -> list[Element]:
     """Find elements with aria-label containing the text."""
     return [
         element
@@ -726,47 +904,57 @@ def _find_by_aria_label(elements: list[Element], text: str) -> list[Element]:
     ]
 
 
+def _group_by_id(elements: Sequence[Element]) -> dict[str, list[Element]]:
+    """Group elements by id attribute, in document order."""
+    by_id: dict[str, list[Element]] = {}
+    for element in elements:
+        element_id = element.attrs.get("id")
+        if element_id is not None:
+            by_id.setdefault(element_id, []).append(element)
+    return by_id
+
+
 def _find_by_label_for(
-    elements: list[Element], label_elements: list[Element], text: str
+    by_id: dict[str, list[Element]], matching_labels: list[Element]
 ) -> list[Element]:
-    """Find elements associated with <label> via 'for' attribute."""
+    """Find elements associated with matching <label>s via 'for' attribute."""
     results = []
-    for label in label_elements:
-        label_text = get_text_content(label)
-        if text in label_text:
-            label_for = label.attrs.get("for")
-            if label_for:
-                for element in elements:
-                    if element.attrs.get("id") == label_for:
-                        results.append(element)
+    for label in matching_labels:
+        label_for = label.attrs.get("for")
+        if label_for:
+            results.extend(by_id.get(label_for, ()))
     return results
 
 
-def _find_by_nested_labels(label_elements: list[Element], text: str) -> list[Element]:
-    """Find form controls nested inside <label> elements containing the text."""
+def _find_by_nested_labels(matching_labels: list[Element]) -> list[Element]:
+    """Find form controls nested inside matching <label> elements."""
     results = []
-    for label in label_elements:
-        label_text = get_text_content(label)
-        if text in label_text:
-            nested_controls = _find_form_controls(label)
-            results.extend(nested_controls)
+    for label in matching_labels:
+        nested_controls = _find_form_controls(label)
+        results.extend(nested_controls)
     return results
 
 
-def _find_by_aria_labelledby(elements: list[Element], text: str) -> list[Element]:
+def _find_by_aria_labelledby(
+    elements: Sequence[Element], by_id: dict[str, list[Element]], text: str
+) -> list[Element]:
     """Find elements with aria-labelledby referencing elements containing the text."""
     results = []
+    # Several controls often reference the same label, whose text is then
+    # only collected once; keyed by id() since Elements are unhashable
+    contains_text: dict[int, bool] = {}
     for element in elements:
         aria_labelledby = element.attrs.get("aria-labelledby")
         if aria_labelledby:
             label_ids = aria_labelledby.split()
             for label_id in label_ids:
-                for potential_label in elements:
-                    if potential_label.attrs.get("id") == label_id:
-                        label_text = get_text_content(potential_label)
-                        if text in label_text:
-                            results.append(element)
-                            break
+                for potential_label in by_id.get(label_id, ()):
+                    key = id(potential_label)
+                    if key not in contains_text:
+                        contains_text[key] = text in get_text_content(potential_label)
+                    if contains_text[key]:
+                        results.append(element)
+                        break
     return results
 
 
@@ -778,46 +966,48 @@ def _query_all_by_label_text_impl(
     max_results: int | None = None,
 ) -> list[Element]:
     """Internal implementation with optional early exit for single-element queries."""
-    # Skip container element itself if container is an Element
-    skip_container = isinstance(container, Element)
-    elements = get_all_elements(container, skip_root=skip_container)
+    elements = _searchable_elements(container)
 
-    results = []
+    # get_by/query_by only need enough matches to tell one from many, so
+    # later strategies are skipped once the earlier ones found that many
+    limit = 1 if find_first else max_results
+
+    # Keyed by id() since Element instances need identity-based uniqueness;
+    # dicts keep insertion order, so results stay in strategy order
+    found: dict[int, Element] = {}
+
+    def has_enough(matches: list[Element]) -> bool:
+        for element in matches:
+            found.setdefault(id(element), element)
+        return limit is not None and len(found) >= limit
 
     # Strategy 1: Find by aria-label
-    aria_label_matches = _find_by_aria_label(elements, text)
-    results.extend(aria_label_matches)
-    if find_first and results:
-        return results
+    if has_enough(_find_by_aria_label(elements, text)):
+        return list(found.values())[:limit]
+
+    # Strategies 2 and 3 share the labels containing the text, so each
+    # label's text content is collected once
+    matching_labels = [
+        el
+        for el in elements
+        if _casefold_tag(el.tag) == "label" and text in get_text_content(el)
+    ]
 
-    # Get all label elements for remaining strategies
-    label_elements = [el for el in elements if el.tag.casefold() == "label"]
+    # Labels and aria-labelledby refer to elements by id; one pass groups
+    # them, instead of rescanning every element for each reference
+    by_id = _group_by_id(elements)
 
     # Strategy 2: Find by <label for="id">
-    label_for_matches = _find_by_label_for(elements, label_elements, text)
-    results.extend(label_for_matches)
-    if find_first and results:
-        return results
+    if has_enough(_find_by_label_for(by_id, matching_labels)):
+        return list(found.values())[:limit]
 
     # Strategy 3: Find by nested form controls in <label>
-    nested_matches = _find_by_nested_labels(label_elements, text)
-    results.extend(nested_matches)
-    if find_first and results:
-        return results
+    if has_enough(_find_by_nested_labels(matching_labels)):
+        return list(found.values())[:limit]
 
     # Strategy 4: Find by aria-labelledby
-    labelledby_matches = _find_by_aria_labelledby(elements, text)
-    results.extend(labelledby_matches)
-
-    # Remove duplicates while preserving order using dict
-    # Dict maintains insertion order since Python 3.7+
-    # Use id() as key since Element instances need identity-based uniqueness
-    unique_results = list({id(el): el for el in results}.values())
-
-    # Apply max_results if specified
-    if max_results is not None:
-        return unique_results[:max_results]
-    return unique_results
+    has_enough(_find_by_aria_labelledby(elements, by_id, text))
+    return list(found.values())[:limit]
 
 
 def query_all_by_label_text(
@@ -851,10 +1041,47 @@ _, _, get_by_label_text, get_all_by_label_text = _make_query_variants(
 
 
 # Tag name-based queries with optional attribute filtering
+@lru_cache(maxsize=256)
+def _tag_attrs_matcher(
+    tag_casefolded: str, attrs: tuple[tuple[str, str], ...]
+) -> Callable[[Element], bool]:
+    """
+    Return a predicate that tests an element's tag and attributes together.
+
+    Args:
+        tag_casefolded: The casefolded tag name to match
+        attrs: Attribute name/value pairs; "in_class" is a class substring test
+
+    Returns:
+        A function of one element, memoized per tag and attrs filter
+    """
+    # Split the filters once, rather than once per element
+    in_class = dict(attrs).get("in_class")
+    expected = tuple(
+        (attr_name, attr_value)
+        for attr_name, attr_value in attrs
+        if attr_name != "in_class"
+    )
+
+    def matches(element: Element) -> bool:
+        if _casefold_tag(element.tag) != tag_casefolded:
+            return False
+        element_attrs = element.attrs
+        for attr_name, attr_value in expected:
+            if element_attrs.get(attr_name) != attr_value:
+                return False
+        # Special handling: check if value is in the class attribute
+        return in_class is None or in_class in (element_attrs.get("class") or "")
+
+    return matches
 
 
 def query_all_by_tag_name(
-    container: Container, tag: str, *, attrs: dict[str, str] | None = None
+    container: Container,
+    tag: str,
+    *,
+    attrs: dict[str, str] | None = None,
+    _max_results: int | None = None,
 ) -> list[Element]:
     """Find all elements with the specified tag name.
 
@@ -863,6 +1090,7 @@ def query_all_by_tag_name(
         tag: The HTML tag name to search for (case-insensitive)
         attrs: Optional dictionary of attribute name/value pairs to filter by.
                Special attribute name "in_class" checks if value is contained in class string.
+        _max_results: Internal parameter for early exit optimization
 
     Returns:
         List of elements matching the criteria
@@ -877,35 +1105,22 @@ def query_all_by_tag_name(
         # Find elements with a specific class (substring match)
         fixed_headers = query_all_by_tag_name(container, "header", attrs={"in_class": "is-fixed"})
     """
-    from aria_testing.utils import find_elements_by_tag
-
-    all_elements = find_elements_by_tag(container, tag)
+    tag_casefolded = _casefold_tag(tag)
 
-    # If no attribute filtering requested, return all matching tags
+    # Without attribute filtering every tag match counts
     if attrs is None:
-        return all_elements
+        if isinstance(container, ElementIndex):
+            return list(container.by_tag.get(tag_casefolded, ())[:_max_results])
+        return find_elements_by_tag(container, tag, max_results=_max_results)
 
-    # Filter by attributes
-    results = []
-    for element in all_elements:
-        # Check if all specified attributes match
-        matches = True
-        for attr_name, attr_value in attrs.items():
-            if attr_name == "in_class":
-                # Special handling: check if value is in the class attribute
-                class_attr = element.attrs.get("class") or ""
-                if attr_value not in class_attr:
-                    matches = False
-                    break
-            else:
-                # Regular attribute exact match
-                if element.attrs.get(attr_name) != attr_value:
-                    matches = False
-                    break
-        if matches:
-            results.append(element)
-
-    return results
+    # Tag and attributes are checked in one pass, so the walk itself stops
+    # early and no intermediate list of tag matches is built
+    # Tests repeat the same filters, so the predicate is built once per shape
+    matches = _tag_attrs_matcher(tag_casefolded, tuple(attrs.items()))
+    if isinstance(container, ElementIndex):
+        candidates = container.by_tag.get(tag_casefolded, ())
+        return list(islice(filter(matches, candidates), _max_results))
+    return _traverse_elements(container, matches, max_results=_max_results)
 
 
 def query_by_tag_name(
@@ -921,7 +1136,7 @@ def query_by_tag_name(
     Returns:
         Single element if found, None otherwise
     """
-    elements = query_all_by_tag_name(container, tag, attrs=attrs)
+    elements = query_all_by_tag_name(container, tag, attrs=attrs, _max_results=1)
     return elements[0] if elements else None
 
 
@@ -942,15 +1157,17 @@ def get_by_tag_name(
         ElementNotFoundError: If no element found
         MultipleElementsError: If multiple elements found
     """
-    elements = query_all_by_tag_name(container, tag, attrs=attrs)
+    # Two matches are enough to tell "one" from "many"
+    elements = query_all_by_tag_name(container, tag, attrs=attrs, _max_results=2)
     if not elements:
         attr_str = f" with attrs {attrs}" if attrs else ""
         raise ElementNotFoundError(f"Unable to find element with tag '{tag}'{attr_str}")
     if len(elements) > 1:
         attr_str = f" with attrs {attrs}" if attrs else ""
+        # Only the error path walks everything, to report the true count
         raise MultipleElementsError(
             f"Found multiple elements with tag '{tag}'{attr_str}",
-            count=len(elements),
+            count=len(query_all_by_tag_name(container, tag, attrs=attrs)),
         )
     return elements[0]
 
@@ -978,3 +1195,97 @@ def get_all_by_tag_name(
             f"Unable to find elements with tag '{tag}'{attr_str}"
         )
     return elements
+
+
+# Combined queries
+
+
+def multi_query(
+    container: Container,
+    *,
+    text: str | None = None,
+    test_id: str | None = None,
+    role: AriaRole | None = None,
+    tag: str | None = None,
+) -> dict[str, Element | None]:
+    """Find the first element for several criteria in a single walk.
+
+    Each criterion matches like its single-element query: text and role skip
+    an Element container itself, while test_id and tag include it. Unlike
+    query_by_*, a criterion with several matches returns the first one in
+    document order instead of raising.
+
+    Args:
+        container: The container to search within
+        text: Text the element's text content must contain
+        test_id: Value of the element's data-testid attribute
+        role: The ARIA role the element must have
+        tag: The HTML tag name (case-insensitive)
+
+    Returns:
+        Dict with a "text", "test_id", "role" or "tag" key for each criterion
+        given, mapping to the first matching element or None
+
+    Example:
+        found = multi_query(container, role="navigation", test_id="save")
+        nav, save = found["role"], found["test_id"]
+    """
+    if isinstance(container, ElementIndex):
+        # An index answers each criterion with a lookup rather than a walk
+        found: dict[str, list[Element]] = {}
+        if text is not None:
+            found["text"] = query_all_by_text(container, text, _max_results=1)
+        if test_id is not None:
+            found["test_id"] = _elements_with_attribute(
+                container, "data-testid", test_id, _max_results=1
+            )
+        if role is not None:
+            found["role"] = query_all_by_role(container, role, _max_results=1)
+        if tag is not None:
+            found["tag"] = query_all_by_tag_name(container, tag, _max_results=1)
+        return {
+            key: elements[0] if elements else None for key, elements in found.items()
+        }
+
+    predicates: dict[str, Callable[[Element], bool]] = {}
+    if text is not None:
+        # Every element's text is joined once up front instead of per element
+        texts = _text_contents(container)
+        predicates["text"] = lambda element: text in texts[id(element)]
+    if test_id is not None:
+        predicates["test_id"] = lambda element: (
+            element.attrs.get("data-testid") == test_id
+        )
+    if role is not None:
+        predicates["role"] = _role_matcher(role)
+    if tag is not None:
+        tag_casefolded = _casefold_tag(tag)
+        predicates["tag"] = lambda element: _casefold_tag(element.tag) == tag_casefolded
+
+    results: dict[str, Element | None] = dict.fromkeys(predicates)
+    pending = dict(predicates)
+    # Text and role queries never match an Element container itself
+    root_pending = {
+        key: matches for key, matches in pending.items() if key not in ("text", "role")
+    }
+
+    stack: list[Node] = [container]
+    while stack and pending:
+        node = stack.pop()
+
+        if isinstance(node, Element):
+            checks = root_pending if node is container else pending
+            for key, matches in list(checks.items()):
+                if matches(node):
+                    results[key] = node
+                    del pending[key]
+            children = node.children
+            if children:
+                stack.extend(reversed(children))
+
+        elif isinstance(node, Fragment):
+            children = node.children
+            if children:
+                stack.extend(reversed(children))
+
+    return results
@@ -3,11 +3,39 @@ Utility functions for text extraction and normalization from tdom nodes.
 """
 
 import re
+import sys
+from collections.abc import Iterable, Mapping
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Callable
 
 from tdom import Element, Fragment, Node, Text
 
 
+@lru_cache(maxsize=512)
+def _casefold_tag(tag: str) -> str:
+    """
+    Return the interned, casefolded form of a tag name.
+
+    Tag names come from a small, highly repetitive vocabulary, so the result is
+    memoized. Pure-ASCII tags (the common case) use the cheaper str.lower(),
+    which is equivalent to casefold() for ASCII input.
+
+    Args:
+        tag: The tag name to casefold
+
+    Returns:
+        The casefolded tag name, interned for fast identity comparisons
+    """
+    return sys.intern(tag.lower() if tag.isascii() else tag.casefold())
+
+
+def _intern(key: str) -> str:
+    """Intern a lookup key so probes with interned literals match on identity."""
+    # sys.intern() rejects str subclasses; those keys still work, just by value
+    return sys.intern(key) if type(key) is str else key
+
+
 def get_text_content(node: Node) -> str:
     """
     Extract all text content from a tdom node, similar to textContent in DOM.
@@ -18,14 +46,40 @@ def get_text_content(node: Node) -> str:
     Returns:
         The concatenated text content of the node and all its descendants
     """
-    match node:
-        case Text():
-            return node.text
-        case Element() | Fragment():
-            return "".join(get_text_content(child) for child in node.children)
-        case _:
-            # For other node types (Comment, DocumentType), return empty string
-            return ""
+    # Plain isinstance() checks are cheaper than match/case class patterns
+    # on this per-node path
+    if isinstance(node, Text):
+        return node.text
+    # For other node types (Comment, DocumentType), return empty string
+    if not isinstance(node, (Element, Fragment)):
+        return ""
+
+    # Leaves such as <img>, <input>, and <br>, and elements holding a single
+    # text node, need no walk
+    children = node.children
+    if not children:
+        return ""
+    if len(children) == 1 and isinstance(children[0], Text):
+        return children[0].text
+
+    # Iterative walk collecting text parts in document order, so deeply
+    # nested trees cannot hit the recursion limit
+    parts: list[str] = []
+    add_part = parts.append
+    stack: list[Node] = children[::-1]
+    extend = stack.extend
+    pop = stack.pop
+
+    while stack:
+        child = pop()
+        if isinstance(child, Text):
+            add_part(child.text)
+        elif isinstance(child, (Element, Fragment)):
+            children = child.children
+            if children:
+                extend(reversed(children))
+
+    return "".join(parts)
 
 
 def normalize_text(
@@ -42,6 +96,11 @@ def normalize_text(
     Returns:
         The normalized text
     """
+    if collapse_whitespace and trim:
+        # str.split() breaks on the same characters as \s and drops the ends,
+        # so this equals re.sub() + strip() without the regex engine
+        return " ".join(text.split())
+
     if collapse_whitespace:
         # Replace any sequence of whitespace characters with a single space
         text = re.sub(r"\s+", " ", text)
@@ -52,6 +111,26 @@ def normalize_text(
     return text
 
 
+@lru_cache(maxsize=256)
+def _prepare_matcher(matcher: str, normalize: bool) -> tuple[str, str]:
+    """
+    Return the matching forms of a string matcher.
+
+    Callers test one matcher against many elements, so the normalized and
+    casefolded forms are memoized rather than recomputed per element.
+
+    Args:
+        matcher: The string to match against
+        normalize: Whether to normalize the matcher first
+
+    Returns:
+        Tuple of (matcher as compared exactly, casefolded matcher)
+    """
+    if normalize:
+        matcher = normalize_text(matcher)
+    return matcher, matcher.casefold()
+
+
 def matches_text(
     element_text: str,
     matcher: str | re.Pattern[str],
@@ -71,25 +150,56 @@ def matches_text(
     Returns:
         True if the text matches, False otherwise
     """
-    if normalize:
-        element_text = normalize_text(element_text)
-
     match matcher:
         case re.Pattern():
+            if normalize:
+                element_text = normalize_text(element_text)
             return bool(matcher.search(element_text))
         case str():
+            expected, expected_casefolded = _prepare_matcher(matcher, normalize)
+
+            # Text that already equals the normalized matcher is unchanged by
+            # normalization, so it matches without normalizing it
+            if exact and element_text == expected:
+                return True
+
+            # A raw substring hit survives both normalization (the matcher has
+            # no whitespace runs or ends to collapse) and casefolding (which
+            # maps each character independently), so skip both copies
+            if not exact and expected in element_text:
+                return True
+
             if normalize:
-                matcher = normalize_text(matcher)
+                element_text = normalize_text(element_text)
 
             if exact:
-                return element_text == matcher
+                return element_text == expected
             else:
-                return matcher.casefold() in element_text.casefold()
+                return expected_casefolded in element_text.casefold()
         case _:
             # This should never happen with correct typing, but included for type exhaustiveness
             return False
 
 
+def _initial_stack(container: Node, skip_root: bool) -> list[Node]:
+    """
+    Build the starting traversal stack for a container.
+
+    Only the container itself can be skipped as root, so the decision is made
+    once here instead of tagging every stacked node with an is_root flag.
+
+    Args:
+        container: The container node to search within
+        skip_root: If True and container is an Element, start from its children
+
+    Returns:
+        A new stack list, with the next node to visit last
+    """
+    if skip_root and isinstance(container, Element):
+        return container.children[::-1]
+    return [container]
+
+
 def _traverse_elements(
     container: Node,
     predicate: Callable[[Element], bool] | None = None,
@@ -112,72 +222,301 @@ def _traverse_elements(
         List of matching elements
     """
     results: list[Element] = []
+    add_result = results.append
 
     # Iterative traversal using a stack (faster than recursion)
-    # Stack contains tuples of (node, is_root)
-    stack: list[tuple[Node, bool]] = [(container, True)]
+    stack = _initial_stack(container, skip_root)
+    extend = stack.extend
+    pop = stack.pop
 
+    # This is the innermost loop of every query, so it binds bound methods to
+    # locals and uses isinstance() rather than match/case class patterns
     while stack:
-        node, is_root = stack.pop()
-
-        match node:
-            case Element():
-                # Add element if not skipping root or not at root
-                if not (skip_root and is_root):
-                    if predicate is None or predicate(node):
-                        results.append(node)
-                        # Early exit optimization
-                        if max_results is not None and len(results) >= max_results:
-                            return results
-
-                # Add children to stack in reverse order (to maintain left-to-right traversal)
-                for child in reversed(node.children):
-                    stack.append((child, False))
-
-            case Fragment():
-                # Fragments are never considered root for skipping
-                for child in reversed(node.children):
-                    stack.append((child, False))
+        node = pop()
+
+        if isinstance(node, Element):
+            if predicate is None or predicate(node):
+                add_result(node)
+                # Early exit optimization
+                if max_results is not None and len(results) >= max_results:
+                    return results
+
+            # Add children to stack in reverse order (to maintain left-to-right traversal).
+            # One C-level extend per parent; leaves skip the reversed() iterator.
+            children = node.children
+            if children:
+                extend(reversed(children))
+
+        elif isinstance(node, Fragment):
+            children = node.children
+            if children:
+                extend(reversed(children))
 
     return results
 
 
-def find_elements_by_attribute(
-    container: Node, attribute: str, value: str | None = None
+def _text_contents(container: Node) -> dict[int, str]:
+    """
+    Compute the text content of container and every node below it in one pass.
+
+    Calling get_text_content() on each element rebuilds every subtree's text
+    once per ancestor. Here each node's text is joined once from its
+    children's already computed texts.
+
+    Args:
+        container: The container node to compute text for
+
+    Returns:
+        Mapping of id() of each Element and Fragment to its text content
+    """
+    # Parents are collected before their children, so walking the list
+    # backwards finishes every child before its parent
+    nodes: list[Element | Fragment] = []
+    stack: list[Node] = [container]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, (Element, Fragment)):
+            nodes.append(node)
+            stack.extend(node.children)
+
+    texts: dict[int, str] = {}
+    for node in reversed(nodes):
+        texts[id(node)] = "".join(
+            child.text if isinstance(child, Text) else texts.get(id(child), "")
+            for child in node.children
+        )
+    return texts
+
+
+def _traverse_containing_text(
+    container: Node,
+    text: str,
+    *,
+    skip_root: bool = False,
+    max_results: int | None = None,
 ) -> list[Element]:
     """
-    Find all elements within container that have the specified attribute.
+    Collect elements whose text content contains text.
+
+    An element's text content is a contiguous slice of its parent's, so when
+    an element does not contain text, none of its descendants can. Those
+    subtrees are skipped, and the texts that are checked are computed
+    together in a single pass.
+
+    Args:
+        container: The container node to search within
+        text: The substring to look for
+        skip_root: If True and container is an Element, exclude the container itself
+        max_results: If set, stop after finding this many matching elements (early exit)
+
+    Returns:
+        List of matching elements in document order
+    """
+    results: list[Element] = []
+    add_result = results.append
+    texts = _text_contents(container)
+
+    stack = _initial_stack(container, skip_root)
+    extend = stack.extend
+    pop = stack.pop
+
+    while stack:
+        node = pop()
+
+        if isinstance(node, Element):
+            if text not in texts[id(node)]:
+                continue
+            add_result(node)
+            if max_results is not None and len(results) >= max_results:
+                return results
+
+            children = node.children
+            if children:
+                extend(reversed(children))
+
+        elif isinstance(node, Fragment):
+            children = node.children
+            if children:
+                extend(reversed(children))
+
+    return results
+
+
+def _traverse_by_tag(
+    container: Node,
+    tag_casefolded: str,
+    *,
+    skip_root: bool = False,
+    max_results: int | None = None,
+) -> list[Element]:
+    """
+    Collect elements whose casefolded tag name equals tag_casefolded.
+
+    Same traversal as _traverse_elements, with the tag comparison inlined so
+    no predicate function is called per element.
+
+    Args:
+        container: The container node to search within
+        tag_casefolded: The casefolded tag name to match
+        skip_root: If True and container is an Element, exclude the container itself
+        max_results: If set, stop after finding this many matching elements (early exit)
+
+    Returns:
+        List of matching elements
+    """
+    results: list[Element] = []
+    add_result = results.append
+    casefold_tag = _casefold_tag
+
+    stack = _initial_stack(container, skip_root)
+    extend = stack.extend
+    pop = stack.pop
+
+    while stack:
+        node = pop()
+
+        if isinstance(node, Element):
+            if casefold_tag(node.tag) == tag_casefolded:
+                add_result(node)
+                if max_results is not None and len(results) >= max_results:
+                    return results
+
+            children = node.children
+            if children:
+                extend(reversed(children))
+
+        elif isinstance(node, Fragment):
+            children = node.children
+            if children:
+                extend(reversed(children))
+
+    return results
+
+
+def _traverse_by_attr(
+    container: Node,
+    attribute: str,
+    value: str | None = None,
+    *,
+    skip_root: bool = False,
+    max_results: int | None = None,
+) -> list[Element]:
+    """
+    Collect elements that have an attribute, optionally with a specific value.
+
+    Same traversal as _traverse_elements, with the attribute check inlined so
+    no predicate function is called per element.
 
     Args:
         container: The container node to search within
         attribute: The attribute name to look for
         value: Optional specific value the attribute must have
+        skip_root: If True and container is an Element, exclude the container itself
+        max_results: If set, stop after finding this many matching elements (early exit)
 
     Returns:
         List of matching elements
     """
+    results: list[Element] = []
+    add_result = results.append
 
-    def predicate(element: Element) -> bool:
-        if attribute not in element.attrs:
-            return False
-        return value is None or element.attrs[attribute] == value
+    stack = _initial_stack(container, skip_root)
+    extend = stack.extend
+    pop = stack.pop
 
-    return _traverse_elements(container, predicate)
+    while stack:
+        node = pop()
+
+        if isinstance(node, Element):
+            # With a value, a single get() answers both questions: a missing
+            # attribute reads as None, which never equals a str value
+            if (
+                attribute in node.attrs
+                if value is None
+                else node.attrs.get(attribute) == value
+            ):
+                add_result(node)
+                if max_results is not None and len(results) >= max_results:
+                    return results
+
+            children = node.children
+            if children:
+                extend(reversed(children))
+
+        elif isinstance(node, Fragment):
+            children = node.children
+            if children:
+                extend(reversed(children))
+
+    return results
 
 
-def find_elements_by_tag(container: Node, tag: str) -> list[Element]:
+def find_elements_by_attribute(
+    container: Node,
+    attribute: str,
+    value: str | None = None,
+    *,
+    max_results: int | None = None,
+) -> list[Element]:
+    """
+    Find all elements within container that have the specified attribute.
+
+    Args:
+        container: The container node to search within
+        attribute: The attribute name to look for
+        value: Optional specific value the attribute must have
+        max_results: If set, stop after finding this many matching elements
+
+    Returns:
+        List of matching elements
+    """
+    # Attribute names from literals are interned already; interning
+    # caller-built names lets dict probes succeed on the identity check
+    return _traverse_by_attr(
+        container, _intern(attribute), value, max_results=max_results
+    )
+
+
+def find_elements_by_tag(
+    container: Node, tag: str, *, max_results: int | None = None
+) -> list[Element]:
     """
     Find all elements within container that have the specified tag name.
 
     Args:
         container: The container node to search within
         tag: The tag name to look for
+        max_results: If set, stop after finding this many elements (early exit optimization)
 
     Returns:
         List of matching elements
     """
-    tag_casefolded = tag.casefold()
-    return _traverse_elements(container, lambda el: el.tag.casefold() == tag_casefolded)
+    return _traverse_by_tag(container, _casefold_tag(tag), max_results=max_results)
+
+
+def find_elements_by_tags(
+    container: Node, tags: Iterable[str]
+) -> dict[str, list[Element]]:
+    """
+    Find the elements for several tag names in a single traversal.
+
+    Args:
+        container: The container node to search within
+        tags: The tag names to look for
+
+    Returns:
+        Dict mapping each casefolded tag name to its elements, in document order.
+        Tags with no matches map to an empty list.
+    """
+    buckets: dict[str, list[Element]] = {_casefold_tag(tag): [] for tag in tags}
+    casefold_tag = _casefold_tag
+
+    for element in _traverse_elements(container):
+        bucket = buckets.get(casefold_tag(element.tag))
+        if bucket is not None:
+            bucket.append(element)
+
+    return buckets
 
 
 def get_all_elements(
@@ -197,6 +536,62 @@ def get_all_elements(
     return _traverse_elements(container, skip_root=skip_root, max_results=max_results)
 
 
+def _name_from_link(element: Element, text: str) -> str | None:
+    """Links are named by their text content and href combined."""
+    href = element.attrs.get("href", "")
+
+    # Combine text and href for comprehensive name matching
+    name_parts = []
+    if text:
+        name_parts.append(text)
+    if href:
+        name_parts.append(href)
+
+    # If neither text nor href, fall through to general fallback
+    return " ".join(name_parts) if name_parts else None
+
+
+def _name_from_button(element: Element, text: str) -> str | None:
+    """Buttons are named by their text content."""
+    return text or None
+
+
+def _name_from_img(element: Element, text: str) -> str | None:
+    """Images are named by alt (even when empty), then title."""
+    alt = element.attrs.get("alt")
+    if alt is not None:  # alt="" is valid
+        return alt
+    # Fallback to title
+    return _stripped_attr(element, "title")
+
+
+def _name_from_form_control(element: Element, text: str) -> str | None:
+    """Form controls are named by value, then placeholder."""
+    return _stripped_attr(element, "value") or _stripped_attr(element, "placeholder")
+
+
+def _stripped_attr(element: Element, attribute: str) -> str | None:
+    """Return an attribute's value stripped of whitespace, or None if blank."""
+    value = element.attrs.get(attribute)
+    if value and (stripped := value.strip()):
+        return stripped
+    return None
+
+
+# Role-specific naming rules. A namer receives the element's stripped text
+# content and returns None to fall through to the general fallbacks.
+_ROLE_NAMERS: Mapping[str, Callable[[Element, str], str | None]] = MappingProxyType(
+    {
+        "link": _name_from_link,
+        "button": _name_from_button,
+        "img": _name_from_img,
+        "textbox": _name_from_form_control,
+        "combobox": _name_from_form_control,
+        "listbox": _name_from_form_control,
+    }
+)
+
+
 def get_accessible_name(element: Element, role: str | None = None) -> str:
     """
     Get the accessible name for an element based on its role and attributes.
@@ -215,74 +610,26 @@ def get_accessible_name(element: Element, role: str | None = None) -> str:
         The computed accessible name as a string
     """
     # Check aria-label first
-    if "aria-label" in element.attrs:
-        aria_label = element.attrs["aria-label"]
-        if aria_label and aria_label.strip():
-            return aria_label.strip()
+    if (aria_label := _stripped_attr(element, "aria-label")) is not None:
+        return aria_label
 
     # Check aria-labelledby
     # Note: Full implementation would traverse the DOM to find elements by ID
     # and concatenate their text content. Skipped for now as it requires
     # container context which this function doesn't have.
 
-    # Role-specific naming
-    match role:
-        case "link":
-            # For links: combine text content and href for name matching
-            text = get_text_content(element).strip()
-            href = element.attrs.get("href", "")
-
-            # Combine text and href for comprehensive name matching
-            name_parts = []
-            if text:
-                name_parts.append(text)
-            if href:
-                name_parts.append(href)
-
-            if name_parts:
-                return " ".join(name_parts)
-
-            # If neither text nor href, fall through to general fallback
-
-        case "button":
-            # For buttons: text content is primary
-            text = get_text_content(element).strip()
-            if text:
-                return text
-
-        case "img":
-            # For images: alt text is primary
-            if "alt" in element.attrs:
-                alt = element.attrs["alt"]
-                if alt is not None:  # alt="" is valid
-                    return alt
-            # Fallback to title
-            if "title" in element.attrs:
-                title = element.attrs["title"]
-                if title and title.strip():
-                    return title.strip()
-
-        case "textbox" | "combobox" | "listbox":
-            # For form controls, check value first, then placeholder, then text content
-            if "value" in element.attrs:
-                value = element.attrs["value"]
-                if value and value.strip():
-                    return value.strip()
-            if "placeholder" in element.attrs:
-                placeholder = element.attrs["placeholder"]
-                if placeholder and placeholder.strip():
-                    return placeholder.strip()
+    # Text content is walked once and shared by the role rules and fallback
+    text = get_text_content(element).strip()
+
+    # Role-specific naming: one table lookup instead of a chain of cases
+    if role is not None and (namer := _ROLE_NAMERS.get(role)) is not None:
+        name = namer(element, text)
+        if name is not None:
+            return name
 
     # General fallback: text content
-    text = get_text_content(element).strip()
     if text:
         return text
 
-    # Final fallback: title attribute
-    if "title" in element.attrs:
-        title = element.attrs["title"]
-        if title and title.strip():
-            return title.strip()
-
-    # No accessible name found
-    return ""
+    # Final fallback: title attribute, or no accessible name found
+    return _stripped_attr(element, "title") or ""
@@ -1,7 +1,9 @@
 """Tests for assertion helpers."""
 
+import sys
+
 import pytest
-from tdom import html
+from tdom import Node, html
 
 from aria_testing import (
     GetAllByClass,
@@ -16,6 +18,30 @@ from aria_testing import (
 )
 
 
+# Shared markup, parsed once per module. Assertion helpers only read the
+# tree, so tests can share these instead of re-parsing identical markup.
+
+
+@pytest.fixture(scope="module")
+def single_button() -> Node:
+    return html(t"<button>Click</button>")
+
+
+@pytest.fixture(scope="module")
+def submit_button() -> Node:
+    return html(t"<div><button>Submit</button></div>")
+
+
+@pytest.fixture(scope="module")
+def two_buttons() -> Node:
+    return html(t"<div><button>First</button><button>Second</button></div>")
+
+
+@pytest.fixture(scope="module")
+def no_article() -> Node:
+    return html(t"<div>No article</div>")
+
+
 # Foundation tests - immutability and __call__ signature
 
 
@@ -26,11 +52,17 @@ def test_frozen_dataclass_immutability() -> None:
         helper.tag_name = "div"  # type: ignore[misc]
 
 
-def test_call_signature_accepts_element() -> None:
+def test_helpers_use_slots() -> None:
+    """Test helper instances carry no per-instance __dict__."""
+    helper = GetAllByRole(role="button").count(2)
+    assert not hasattr(helper, "__dict__")
+    assert not hasattr(GetByClass(class_name="btn"), "__dict__")
+
+
+def test_call_signature_accepts_element(single_button: Node) -> None:
     """Test __call__ accepts Element."""
     helper = GetByTagName(tag_name="button")
-    element = html(t"<button>Click</button>")
-    helper(element)  # Should not raise
+    helper(single_button)  # Should not raise
 
 
 def test_call_signature_accepts_fragment() -> None:
@@ -41,6 +73,29 @@ def test_call_signature_accepts_fragment() -> None:
         helper(fragment)
 
 
+def _fresh(value: str) -> str:
+    """Return an equal str built at runtime, so it is not the interned literal."""
+    return "".join(list(value))
+
+
+def test_query_fields_are_interned() -> None:
+    """Test query string fields are interned, including after fluent calls."""
+    role = _fresh("button")
+    name = _fresh("Submit")
+    helper = GetByRole(role=role, name=name)
+    assert helper.role is sys.intern("button")
+    assert helper.name is sys.intern("Submit")
+    assert helper.not_().role is helper.role
+    assert GetAllByTagName(tag_name=_fresh("div")).tag_name is sys.intern("div")
+
+    checked = helper.text_content(_fresh("Save")).with_attribute(
+        _fresh("type"), _fresh("submit")
+    )
+    assert checked.expected_text is sys.intern("Save")
+    assert checked.attribute_name is sys.intern("type")
+    assert checked.attribute_value is sys.intern("submit")
+
+
 # Query helper tests - single element queries
 
 
@@ -58,25 +113,22 @@ def test_get_by_role_with_level() -> None:
     helper(container)  # Should not raise
 
 
-def test_get_by_role_with_name() -> None:
+def test_get_by_role_with_name(submit_button: Node) -> None:
     """Test GetByRole finds element with accessible name."""
     helper = GetByRole(role="button", name="Submit")
-    container = html(t"<div><button>Submit</button></div>")
-    helper(container)  # Should not raise
+    helper(submit_button)  # Should not raise
 
 
-def test_get_by_text_finds_element() -> None:
+def test_get_by_text_finds_element(submit_button: Node) -> None:
     """Test GetByText finds element with text."""
     helper = GetByText(text="Submit")
-    element = html(t"<div><button>Submit</button></div>")
-    helper(element)  # Should not raise
+    helper(submit_button)  # Should not raise
 
 
-def test_get_by_test_id_finds_element() -> None:
+def test_get_by_test_id_finds_element(single_button: Node) -> None:
     """Test GetByTestId finds element by test ID."""
     helper = GetByTagName(tag_name="button")
-    element = html(t"<button>Click</button>")
-    helper(element)  # Should not raise
+    helper(single_button)  # Should not raise
 
 
 def test_get_by_class_finds_element() -> None:
@@ -93,27 +145,24 @@ def test_get_by_id_finds_element() -> None:
     helper(element)  # Should not raise
 
 
-def test_get_by_tag_name_finds_element() -> None:
+def test_get_by_tag_name_finds_element(single_button: Node) -> None:
     """Test GetByTagName finds element by tag."""
     helper = GetByTagName(tag_name="button")
-    element = html(t"<button>Click</button>")
-    helper(element)  # Should not raise
+    helper(single_button)  # Should not raise
 
 
-def test_query_failure_raises_assertion_error() -> None:
+def test_query_failure_raises_assertion_error(no_article: Node) -> None:
     """Test query failure raises AssertionError."""
     helper = GetByTagName(tag_name="article")
-    element = html(t"<div>No article</div>")
     with pytest.raises(AssertionError):
-        helper(element)
+        helper(no_article)
 
 
-def test_query_failure_includes_detailed_error_message() -> None:
+def test_query_failure_includes_detailed_error_message(no_article: Node) -> None:
     """Test query failure includes detailed error message."""
     helper = GetByTagName(tag_name="article")
-    element = html(t"<div>No article</div>")
     with pytest.raises(AssertionError) as exc_info:
-        helper(element)
+        helper(no_article)
     error_msg = str(exc_info.value)
     assert "article" in error_msg
     assert "Query:" in error_msg
@@ -215,11 +264,10 @@ def test_immutability_preserved_by_fluent_api() -> None:
 # GetAllBy* tests - count and nth operations
 
 
-def test_get_all_by_role_returns_list() -> None:
+def test_get_all_by_role_returns_list(two_buttons: Node) -> None:
     """Test GetAllByRole works with multiple elements."""
     helper = GetAllByRole(role="button")
-    element = html(t"<div><button>First</button><button>Second</button></div>")
-    helper(element)  # Should not raise
+    helper(two_buttons)  # Should not raise
 
 
 def test_get_all_by_text_returns_list() -> None:
@@ -236,36 +284,32 @@ def test_get_all_by_tag_name_returns_list() -> None:
     helper(element)  # Should not raise
 
 
-def test_count_assertion_success() -> None:
+def test_count_assertion_success(two_buttons: Node) -> None:
     """Test .count() succeeds when count matches."""
     helper = GetAllByRole(role="button").count(2)
-    element = html(t"<div><button>First</button><button>Second</button></div>")
-    helper(element)  # Should not raise
+    helper(two_buttons)  # Should not raise
 
 
-def test_count_assertion_failure() -> None:
+def test_count_assertion_failure(two_buttons: Node) -> None:
     """Test .count() fails when count doesn't match."""
     helper = GetAllByRole(role="button").count(3)
-    element = html(t"<div><button>First</button><button>Second</button></div>")
     with pytest.raises(AssertionError) as exc_info:
-        helper(element)
+        helper(two_buttons)
     error_msg = str(exc_info.value)
     assert "Expected count: 3" in error_msg
     assert "found: 2" in error_msg
 
 
-def test_nth_selects_element() -> None:
+def test_nth_selects_element(two_buttons: Node) -> None:
     """Test .nth() selects specific element."""
     helper = GetAllByRole(role="button").nth(0).text_content("First")
-    element = html(t"<div><button>First</button><button>Second</button></div>")
-    helper(element)  # Should not raise
+    helper(two_buttons)  # Should not raise
 
 
-def test_nth_with_text_content() -> None:
+def test_nth_with_text_content(two_buttons: Node) -> None:
     """Test .nth() chains with .text_content()."""
     helper = GetAllByRole(role="button").nth(1).text_content("Second")
-    element = html(t"<div><button>First</button><button>Second</button></div>")
-    helper(element)  # Should not raise
+    helper(two_buttons)  # Should not raise
 
 
 def test_nth_with_attribute() -> None:
@@ -277,23 +321,21 @@ def test_nth_with_attribute() -> None:
     helper(element)  # Should not raise
 
 
-def test_nth_out_of_bounds() -> None:
+def test_nth_out_of_bounds(two_buttons: Node) -> None:
     """Test .nth() fails when index is out of bounds."""
     helper = GetAllByRole(role="button").nth(5)
-    element = html(t"<div><button>First</button><button>Second</button></div>")
     with pytest.raises(AssertionError) as exc_info:
-        helper(element)
+        helper(two_buttons)
     error_msg = str(exc_info.value)
     assert "Index 5 out of bounds" in error_msg
     assert "found 2 elements" in error_msg
 
 
-def test_count_and_nth_together() -> None:
+def test_count_and_nth_together(two_buttons: Node) -> None:
     """Test .count() and .nth() can't be used together effectively."""
     # Note: In practice, count() verifies total but nth() still selects
     helper = GetAllByRole(role="button").count(2).nth(0).text_content("First")
-    element = html(t"<div><button>First</button><button>Second</button></div>")
-    helper(element)  # Should not raise
+    helper(two_buttons)  # Should not raise
 
 
 # Additional coverage for GetAllBy* helpers
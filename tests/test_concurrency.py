@@ -3,22 +3,38 @@ Test thread safety and free-threading compatibility.
 
 These tests verify that aria-testing works correctly in multi-threaded environments,
 including Python 3.14's free-threaded (no-GIL) mode.
+
+aria-testing is pure Python, so importing it never re-enables the GIL on a
+free-threaded build; TestFreeThreadedBuild guards that.
 """
 
-import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import gc
+import os
+import subprocess
+import sys
+import sysconfig
+from concurrent.futures import ThreadPoolExecutor
+from types import FrameType, MappingProxyType
 
 import pytest
+from tdom import Element
 from tdom.processor import html
 
 from aria_testing import (
+    build_index,
     get_all_by_role,
     get_by_label_text,
     get_by_role,
     get_by_test_id,
     get_by_text,
+    get_text_content,
+    queries,
     query_all_by_class,
+    query_all_by_text,
+    utils,
 )
+from aria_testing.index import ElementIndex
+from aria_testing.queries import _INPUT_TYPE_MAP, _ROLE_MAP, get_role_for_element
 
 # Sample HTML for testing
 SAMPLE_HTML = html(
@@ -61,24 +77,21 @@ class TestConcurrentQueries:
 
     def test_concurrent_role_queries(self):
         """Multiple threads can query by role simultaneously."""
-        results = []
         errors = []
 
-        def query_role(role: str) -> None:
+        def query_role(role: str) -> tuple[str, int] | None:
             try:
                 elements = get_all_by_role(SAMPLE_HTML, role)
-                results.append((role, len(elements)))
+                return role, len(elements)
             except Exception as e:
                 errors.append((role, e))
+                return None
 
         # Query different roles from multiple threads
         with ThreadPoolExecutor(max_workers=10) as executor:
             roles = ["link", "button", "heading", "navigation", "textbox"]
-            futures = [executor.submit(query_role, role) for role in roles * 20]
-
             # Wait for all to complete
-            for future in as_completed(futures):
-                future.result()
+            results = list(executor.map(query_role, roles * 20))
 
         # Verify no errors occurred
         assert len(errors) == 0, f"Errors in concurrent queries: {errors}"
@@ -95,25 +108,22 @@ class TestConcurrentQueries:
 
     def test_concurrent_text_queries(self):
         """Multiple threads can query by text simultaneously using query_all."""
-        results = []
         errors = []
 
-        def query_article_text() -> None:
+        def query_article_text() -> tuple[str, int] | None:
             try:
                 # Use query_all_by_text which doesn't raise on multiple matches
-                from aria_testing import query_all_by_text
-
                 elements = query_all_by_text(SAMPLE_HTML, "Article Title")
-                results.append(("Article Title", len(elements)))
+                return "Article Title", len(elements)
             except Exception as e:
                 errors.append(("Article Title", e))
+                return None
 
         with ThreadPoolExecutor(max_workers=10) as executor:
             # Run the same query 100 times concurrently
             futures = [executor.submit(query_article_text) for _ in range(100)]
 
-            for future in as_completed(futures):
-                future.result()
+            results = [future.result() for future in futures]
 
         assert len(errors) == 0, f"Errors in concurrent text queries: {errors}"
         assert len(results) == 100
@@ -125,36 +135,39 @@ class TestConcurrentQueries:
 
     def test_concurrent_mixed_queries(self):
         """Multiple threads can perform different query types simultaneously."""
-        results = []
         errors = []
 
-        def query_1() -> None:
+        def query_1() -> tuple[str, object] | None:
             try:
                 links = get_all_by_role(SAMPLE_HTML, "link")
-                results.append(("links", len(links)))
+                return "links", len(links)
             except Exception as e:
                 errors.append(("query_1", e))
+                return None
 
-        def query_2() -> None:
+        def query_2() -> tuple[str, object] | None:
             try:
                 button = get_by_role(SAMPLE_HTML, "button", name="Submit")
-                results.append(("submit_button", button.attrs.get("type")))
+                return "submit_button", button.attrs.get("type")
             except Exception as e:
                 errors.append(("query_2", e))
+                return None
 
-        def query_3() -> None:
+        def query_3() -> tuple[str, object] | None:
             try:
                 email = get_by_label_text(SAMPLE_HTML, "Email")
-                results.append(("email_input", email.attrs.get("type")))
+                return "email_input", email.attrs.get("type")
             except Exception as e:
                 errors.append(("query_3", e))
+                return None
 
-        def query_4() -> None:
+        def query_4() -> tuple[str, object] | None:
             try:
                 cards = query_all_by_class(SAMPLE_HTML, "card")
-                results.append(("cards", len(cards)))
+                return "cards", len(cards)
             except Exception as e:
                 errors.append(("query_4", e))
+                return None
 
         with ThreadPoolExecutor(max_workers=20) as executor:
             # Run different query types concurrently, multiple times
@@ -165,8 +178,7 @@ class TestConcurrentQueries:
                 futures.append(executor.submit(query_3))
                 futures.append(executor.submit(query_4))
 
-            for future in as_completed(futures):
-                future.result()
+            results = [future.result() for future in futures]
 
         assert len(errors) == 0, f"Errors in mixed queries: {errors}"
         assert len(results) == 100
@@ -185,29 +197,77 @@ class TestConcurrentQueries:
         assert all(count == 3 for count in card_counts)
 
 
+class TestSharedIndex:
+    """Test that one ElementIndex can serve many threads without locking."""
+
+    def test_concurrent_queries_on_shared_index(self):
+        """Threads querying one shared index see the same results as the tree."""
+        index = build_index(SAMPLE_HTML)
+        errors = []
+
+        def query_index() -> tuple[int, str | None, int, Element] | None:
+            try:
+                links = get_all_by_role(index, "link")
+                submit = get_by_role(index, "button", name="Submit")
+                cards = query_all_by_class(index, "card")
+                email = get_by_label_text(index, "Email")
+                return len(links), submit.attrs["type"], len(cards), email
+            except Exception as e:
+                errors.append(e)
+                return None
+
+        with ThreadPoolExecutor(max_workers=20) as executor:
+            futures = [executor.submit(query_index) for _ in range(200)]
+
+            results = [future.result() for future in futures]
+
+        assert len(errors) == 0, f"Errors querying shared index: {errors}"
+        assert len(results) == 200
+
+        expected_email = get_by_label_text(SAMPLE_HTML, "Email")
+        for links, submit_type, cards, email in results:
+            assert (links, submit_type, cards) == (3, "submit", 3)
+            assert email is expected_email
+
+    def test_concurrent_index_builds_are_identical(self):
+        """Indexes built from the same tree in different threads agree."""
+
+        def snapshot(index: ElementIndex) -> tuple:
+            return (
+                tuple(map(id, index.elements)),
+                {role: tuple(map(id, els)) for role, els in index.by_role.items()},
+                {cls: tuple(map(id, els)) for cls, els in index.by_class.items()},
+                dict(index.names),
+            )
+
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            indexes = executor.map(build_index, [SAMPLE_HTML] * 50)
+            snapshots = [snapshot(index) for index in indexes]
+
+        expected = snapshot(build_index(SAMPLE_HTML))
+        assert all(snap == expected for snap in snapshots)
+
+
 class TestConcurrentContainers:
     """Test that multiple threads can work with different containers."""
 
     def test_independent_containers(self):
         """Each thread can work with its own container independently."""
-        results = []
         errors = []
 
-        def process_html(thread_id: int) -> None:
+        def process_html(thread_id: int) -> tuple[int, str] | None:
             try:
                 container = html(t"""<div><h1>Thread {thread_id}</h1></div>""")
                 # Verify we can find the heading
                 _ = get_by_role(container, "heading", level=1)
                 text_content = get_by_text(container, f"Thread {thread_id}")
-                results.append((thread_id, text_content.tag))
+                return thread_id, text_content.tag
             except Exception as e:
                 errors.append((thread_id, e))
+                return None
 
         with ThreadPoolExecutor(max_workers=10) as executor:
-            futures = [executor.submit(process_html, i) for i in range(50)]
-
-            for future in as_completed(futures):
-                future.result()
+            results = list(executor.map(process_html, range(50)))
 
         assert len(errors) == 0, f"Errors processing independent containers: {errors}"
         assert len(results) == 50
@@ -215,10 +275,9 @@ class TestConcurrentContainers:
 
     def test_concurrent_container_creation_and_query(self):
         """Threads can create containers and query them concurrently."""
-        results = []
         errors = []
 
-        def create_and_query(idx: int) -> None:
+        def create_and_query(idx: int) -> tuple[int, str, str | None] | None:
             try:
                 # Each thread creates its own container
                 container = html(
@@ -235,20 +294,16 @@ class TestConcurrentContainers:
                 link = get_by_role(container, "link")
 
                 # Get button text and link href
-                from aria_testing import get_text_content
-
                 button_text = get_text_content(button)
                 href = link.attrs["href"]
 
-                results.append((idx, button_text, href))
+                return idx, button_text, href
             except Exception as e:
                 errors.append((idx, e))
+                return None
 
         with ThreadPoolExecutor(max_workers=20) as executor:
-            futures = [executor.submit(create_and_query, i) for i in range(100)]
-
-            for future in as_completed(futures):
-                future.result()
+            results = list(executor.map(create_and_query, range(100)))
 
         assert len(errors) == 0, f"Errors in container creation: {errors}"
         assert len(results) == 100
@@ -265,39 +320,36 @@ class TestThreadSafetyStress:
     def test_high_concurrency_stress(self):
         """Stress test with many concurrent queries."""
         errors = []
-        success_count = 0
-        lock = threading.Lock()
 
-        def stress_query() -> None:
-            nonlocal success_count
+        def stress_query() -> bool:
             try:
                 # Perform multiple queries
                 get_by_role(SAMPLE_HTML, "heading", level=1)
                 get_all_by_role(SAMPLE_HTML, "link")
                 get_by_role(SAMPLE_HTML, "button", name="Submit")
                 query_all_by_class(SAMPLE_HTML, "card")
-
-                with lock:
-                    success_count += 1
             except Exception as e:
                 errors.append(e)
+                return False
+            return True
 
         with ThreadPoolExecutor(max_workers=50) as executor:
             # Run 500 concurrent queries
             futures = [executor.submit(stress_query) for _ in range(500)]
 
-            for future in as_completed(futures):
-                future.result()
+            # Each future reports its own success, so workers never contend
+            # on a shared counter
+            success_count = sum(future.result() for future in futures)
 
         assert len(errors) == 0, f"Errors under stress: {errors}"
         assert success_count == 500
 
     def test_repeated_queries_consistency(self):
         """Verify query results are consistent across many iterations."""
-        results = {}
         errors = []
 
-        def repeated_query(thread_id: int) -> None:
+        def repeated_query(thread_id: int) -> set[tuple[int, int, int]]:
+            counts = set()
             try:
                 # Each thread performs the same queries multiple times
                 for _ in range(100):
@@ -306,21 +358,19 @@ class TestThreadSafetyStress:
                     headings = get_all_by_role(SAMPLE_HTML, "heading")
 
                     # Store counts
-                    results[thread_id] = (len(links), len(buttons), len(headings))
+                    counts.add((len(links), len(buttons), len(headings)))
             except Exception as e:
                 errors.append((thread_id, e))
+            return counts
 
         with ThreadPoolExecutor(max_workers=10) as executor:
-            futures = [executor.submit(repeated_query, i) for i in range(10)]
-
-            for future in as_completed(futures):
-                future.result()
+            # Merge each thread's counts once it has finished
+            all_results = list(set().union(*executor.map(repeated_query, range(10))))
 
         assert len(errors) == 0, f"Errors in repeated queries: {errors}"
 
-        # All threads should get the same counts
-        all_results = list(results.values())
-        assert len(set(all_results)) == 1, "Inconsistent results across threads"
+        # All threads and iterations should get the same counts
+        assert len(all_results) == 1, "Inconsistent results across threads"
         assert all_results[0] == (3, 2, 2)  # 3 links, 2 buttons, 2 headings
 
 
@@ -329,8 +379,6 @@ class TestImmutableDataStructures:
 
     def test_role_map_immutability(self):
         """Verify role mappings cannot be modified even under concurrent access."""
-        from aria_testing.queries import _INPUT_TYPE_MAP, _ROLE_MAP
-
         errors = []
 
         def try_modify_role_map() -> None:
@@ -357,20 +405,39 @@ class TestImmutableDataStructures:
                 futures.append(executor.submit(try_modify_role_map))
                 futures.append(executor.submit(try_modify_input_map))
 
-            for future in as_completed(futures):
+            for future in futures:
                 future.result()
 
         assert len(errors) == 0, f"Unexpected modifications: {errors}"
 
+    @pytest.mark.parametrize(
+        "module, name",
+        [
+            (queries, "_ROLE_MAP"),
+            (queries, "_INPUT_TYPE_MAP"),
+            (utils, "_ROLE_NAMERS"),
+        ],
+    )
+    def test_mapping_proxies_own_their_dicts(self, module, name):
+        """Only the read-only proxy references the dict behind a lookup table."""
+        proxy = getattr(module, name)
+        assert isinstance(proxy, MappingProxyType)
+
+        (inner,) = gc.get_referents(proxy)
+        assert type(inner) is dict
+
+        # No module-level name keeps a writable handle on the dict
+        referrers = [
+            ref for ref in gc.get_referrers(inner) if not isinstance(ref, FrameType)
+        ]
+        assert all(isinstance(ref, MappingProxyType) for ref in referrers)
+        assert not [value for value in vars(module).values() if value is inner]
+
     def test_concurrent_role_lookups(self):
         """Verify role lookups are thread-safe and consistent."""
-        from aria_testing.queries import get_role_for_element
-        from tdom import Element
-
-        results = []
         errors = []
 
-        def lookup_roles() -> None:
+        def lookup_roles() -> tuple[str | None, str | None, str | None] | None:
             try:
                 # Create test elements
                 button_container = html(t"<button>Click me</button>")
@@ -393,15 +460,15 @@ class TestImmutableDataStructures:
                 nav_role = get_role_for_element(nav) if nav else None
                 heading_role = get_role_for_element(heading) if heading else None
 
-                results.append((button_role, nav_role, heading_role))
+                return button_role, nav_role, heading_role
             except Exception as e:
                 errors.append(e)
+                return None
 
         with ThreadPoolExecutor(max_workers=20) as executor:
             futures = [executor.submit(lookup_roles) for _ in range(100)]
 
-            for future in as_completed(futures):
-                future.result()
+            results = [future.result() for future in futures]
 
         assert len(errors) == 0, f"Errors in role lookups: {errors}"
 
@@ -410,12 +477,27 @@ class TestImmutableDataStructures:
         assert results[0] == ("button", "navigation", "heading")
 
 
-# Mark all tests to run with pytest-xdist
-pytestmark = pytest.mark.usefixtures("_verify_parallel_execution")
-
-
-@pytest.fixture
-def _verify_parallel_execution():
-    """Fixture that ensures tests can run in parallel."""
-    # This fixture does nothing, but its presence ensures pytest-xdist compatibility
-    yield
+@pytest.mark.skipif(
+    not sysconfig.get_config_var("Py_GIL_DISABLED"),
+    reason="requires a free-threaded Python build",
+)
+class TestFreeThreadedBuild:
+    """Test behaviour specific to free-threaded (no-GIL) builds."""
+
+    def test_import_keeps_gil_disabled(self):
+        """Importing aria-testing and tdom must not re-enable the GIL."""
+        # A fresh interpreter, without PYTHON_GIL or -X gil forcing the
+        # setting, so only the imported modules decide whether it is enabled
+        env = {key: value for key, value in os.environ.items() if key != "PYTHON_GIL"}
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import aria_testing, tdom, sys; print(sys._is_gil_enabled())",
+            ],
+            capture_output=True,
+            text=True,
+            env=env,
+            check=True,
+        )
+        assert result.stdout.strip() == "False", result.stderr
@@ -0,0 +1,198 @@
+"""
+Tests for aria_testing.index module.
+"""
+
+import dataclasses
+import re
+import sys
+
+import pytest
+from tdom.processor import html
+
+from aria_testing import (
+    build_index,
+    get_all_by_tag_name,
+    get_by_id,
+    query_all_by_class,
+    query_all_by_label_text,
+    query_all_by_role,
+    query_all_by_tag_name,
+    query_all_by_test_id,
+    query_all_by_text,
+    query_by_id,
+)
+from aria_testing.errors import ElementNotFoundError
+from aria_testing.index import ElementIndex
+
+
+@pytest.fixture
+def sample_document():
+    """Create a sample document structure for testing."""
+    return html(t"""<div class="page">
+        <nav><a href="/">Home</a><a href="/docs">Docs</a></nav>
+        <label for="email">Email</label>
+        <input id="email" type="email" />
+        <button class="btn primary" data-testid="save">Save</button>
+        <button class="btn" data-testid="cancel">Cancel</button>
+        <p>Hello world</p>
+    </div>""")
+
+
+def test_build_index_elements_in_document_order(sample_document):
+    index = build_index(sample_document)
+
+    assert isinstance(index, ElementIndex)
+    assert index.root is sample_document
+    assert index.elements[0] is sample_document
+    assert [el.tag for el in index.descendants] == [
+        "nav",
+        "a",
+        "a",
+        "label",
+        "input",
+        "button",
+        "button",
+        "p",
+    ]
+
+
+def test_build_index_groups_by_casefolded_tag(sample_document):
+    index = build_index(sample_document)
+
+    assert [el.attrs["href"] for el in index.by_tag["a"]] == ["/", "/docs"]
+    assert len(index.by_tag["button"]) == 2
+
+
+def test_build_index_groups_by_attribute_name(sample_document):
+    index = build_index(sample_document)
+
+    assert [el.attrs["data-testid"] for el in index.by_attr["data-testid"]] == [
+        "save",
+        "cancel",
+    ]
+    assert index.by_attr["class"][0] is sample_document
+
+
+def test_build_index_fragment_has_no_root_element():
+    fragment = html(t"<p>One</p><p>Two</p>")
+    index = build_index(fragment)
+
+    assert index.descendants is index.elements
+    assert len(index.elements) == 2
+
+
+def test_element_index_is_immutable(sample_document):
+    index = build_index(sample_document)
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        index.elements = ()  # type: ignore[misc]
+    with pytest.raises(TypeError):
+        index.by_tag["div"] = ()  # type: ignore[index]
+    assert isinstance(index.by_tag["a"], tuple)
+
+
+def test_element_index_str_renders_root(sample_document):
+    index = build_index(sample_document)
+
+    assert str(index) == str(sample_document)
+    assert repr(index) == "ElementIndex(root=<Element>, elements=9)"
+
+
+@pytest.mark.parametrize(
+    "query, args",
+    [
+        (query_all_by_role, ("button",)),
+        (query_all_by_role, ("link",)),
+        (query_all_by_text, ("Save",)),
+        (query_all_by_class, ("btn",)),
+        (query_all_by_class, ("page",)),
+        (query_all_by_label_text, ("Email",)),
+        (query_all_by_test_id, ("cancel",)),
+        (query_all_by_tag_name, ("a",)),
+        (query_all_by_tag_name, ("div",)),
+    ],
+)
+def test_index_queries_match_tree_queries(sample_document, query, args):
+    index = build_index(sample_document)
+
+    from_tree = query(sample_document, *args)
+    from_index = query(index, *args)
+
+    assert [id(el) for el in from_index] == [id(el) for el in from_tree]
+
+
+def test_build_index_groups_by_id_and_class_token():
+    container = html(t"""<div id="root" class="page">
+        <button id="a" class="btn btn">One</button>
+        <button id="b" class="btn primary">Two</button>
+    </div>""")
+    index = build_index(container)
+
+    assert index.by_id["root"] == (container,)
+    assert [el.attrs["id"] for el in index.by_class["btn"]] == ["a", "b"]
+    assert [el.attrs["id"] for el in index.by_class["primary"]] == ["b"]
+    # Class queries skip the root, matching the tree queries
+    assert "page" not in index.by_class
+
+
+def test_build_index_interns_lookup_keys():
+    # Built at runtime so the parser cannot hand back interned literals
+    suffix = "".join(list("-x"))
+    container = html(t"""<div>
+        <p id={"main" + suffix} class={"note" + suffix} role={"note" + suffix}>Hi</p>
+    </div>""")
+    index = build_index(container)
+
+    for mapping in (index.by_attr, index.by_id, index.by_class, index.by_role):
+        for key in mapping:
+            assert key is sys.intern(key)
+    assert index.by_id["main-x"][0].tag == "p"
+
+
+def test_build_index_groups_descendants_by_role():
+    nav = html(t"""<nav>
+        <h1>Title</h1><h2>Subtitle</h2><a href="/">Home</a>
+    </nav>""")
+    index = build_index(nav)
+
+    assert [el.tag for el in index.by_role["heading"]] == ["h1", "h2"]
+    # The root is not one of its own search results
+    assert "navigation" not in index.by_role
+    assert query_all_by_role(index, "heading", level=2) == [index.by_tag["h2"][0]]
+
+
+def test_build_index_precomputes_accessible_names(sample_document):
+    index = build_index(sample_document)
+
+    names = [index.names[id(el)] for el in index.by_tag["button"]]
+    assert names == ["Save", "Cancel"]
+    # Elements without a role have no name entry
+    assert id(index.by_tag["label"][0]) not in index.names
+
+
+def test_index_role_query_by_name(sample_document):
+    index = build_index(sample_document)
+
+    assert [
+        el.attrs["href"] for el in query_all_by_role(index, "link", name="Docs")
+    ] == ["/docs"]
+    assert query_all_by_role(index, "button", name=re.compile("^Can")) == (
+        query_all_by_role(sample_document, "button", name=re.compile("^Can"))
+    )
+
+
+def test_index_tag_name_query_with_attrs(sample_document):
+    index = build_index(sample_document)
+
+    links = get_all_by_tag_name(index, "A", attrs={"href": "/docs"})
+    assert len(links) == 1
+    assert links[0].attrs["href"] == "/docs"
+
+
+def test_index_id_queries(sample_document):
+    index = build_index(sample_document)
+
+    assert get_by_id(index, "email").tag == "input"
+    assert query_by_id(index, "missing") is None
+    with pytest.raises(ElementNotFoundError):
+        get_by_id(index, "missing")
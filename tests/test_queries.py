@@ -2,11 +2,18 @@
 Tests for aria_testing.queries module.
 """
 
+from enum import StrEnum
+
 import pytest
+from tdom import Element, Fragment
 from tdom.processor import html
 
 from aria_testing.errors import ElementNotFoundError, MultipleElementsError
+from aria_testing.index import build_index
 from aria_testing.queries import (
+    _find_form_controls,
+    _role_matcher,
+    _tag_attrs_matcher,
     get_all_by_class,
     get_all_by_label_text,
     get_all_by_role,
@@ -21,6 +28,7 @@ from aria_testing.queries import (
     get_by_test_id,
     get_by_text,
     get_role_for_element,
+    multi_query,
     query_all_by_class,
     query_all_by_label_text,
     query_all_by_role,
@@ -35,13 +43,14 @@ from aria_testing.queries import (
     query_by_test_id,
     query_by_text,
 )
-from aria_testing.utils import get_text_content
+from aria_testing.utils import get_all_elements, get_text_content
 
 
-@pytest.fixture
-def sample_document():
-    """Create a sample document structure for testing."""
-    return html(t"""<div>
+# Queries never mutate a tree, so parsed documents are shared per module
+@pytest.fixture(scope="module", params=["tree", "index"])
+def sample_document(request):
+    """Create a sample document, as a plain tree and as an ElementIndex."""
+    document = html(t"""<div>
         <h1>Welcome</h1>
         <p>Hello world</p>
         <button>Click me</button>
@@ -53,17 +62,17 @@ def sample_document():
         <button data-testid="save">Save</button>
         <button data-testid="cancel">Cancel</button>
     </div>""")
+    return build_index(document) if request.param == "index" else document
 
 
-def test_query_by_text_exact_match(sample_document):
-    element = query_by_text(sample_document, "Hello world")
-    assert element is not None
-    assert element.tag == "p"
-
-
-def test_query_by_text_not_found(sample_document):
-    element = query_by_text(sample_document, "Not found")
-    assert element is None
+@pytest.mark.parametrize(
+    "text, expected_tag",
+    [("Hello world", "p"), ("Welcome", "h1"), ("Not found", None)],
+    ids=["exact_match", "heading", "not_found"],
+)
+def test_query_by_text(sample_document, text, expected_tag):
+    element = query_by_text(sample_document, text)
+    assert (element.tag if element is not None else None) == expected_tag
 
 
 # Note: substring and regex matching not implemented yet
@@ -118,6 +127,23 @@ def test_query_all_by_text():
     assert elements[1].tag == "span"
 
 
+@pytest.mark.parametrize("text", ["Save", "Sa", "ve d", "Save draft", "", "zzz"])
+def test_query_all_by_text_pruning_matches_full_scan(text):
+    """Skipping subtrees without the text never drops a match."""
+    container = html(t"""<div>
+        <section><p>Save <b>draft</b></p><p>Discard</p></section>
+        <ul><li>Sa<i>ve</i></li><li>Other</li></ul>
+        <footer><span>Saved</span></footer>
+    </div>""")
+
+    expected = [
+        id(el)
+        for el in get_all_elements(container, skip_root=True)
+        if text in get_text_content(el)
+    ]
+    assert [id(el) for el in query_all_by_text(container, text)] == expected
+
+
 def test_get_all_by_text_success():
     container = html(t"""<div>
         <p>item</p>
@@ -212,27 +238,25 @@ def test_implicit_role_button():
     assert element.tag == "button"
 
 
-def test_implicit_role_heading():
-    container = html(t"""<div>
+@pytest.fixture(scope="module")
+def heading_tree():
+    return html(t"""<div>
         <h1>Title</h1>
         <h2>Subtitle</h2>
     </div>""")
 
-    elements = query_all_by_role(container, "heading")
+
+def test_implicit_role_heading(heading_tree):
+    elements = query_all_by_role(heading_tree, "heading")
     assert len(elements) == 2
 
 
-def test_heading_with_level():
-    container = html(t"""<div>
-        <h1>Title</h1>
-        <h2>Subtitle</h2>
-    </div>""")
-
-    element = query_by_role(container, "heading", level=1)
+def test_heading_with_level(heading_tree):
+    element = query_by_role(heading_tree, "heading", level=1)
     assert element is not None
     assert element.tag == "h1"
 
-    element = query_by_role(container, "heading", level=3)
+    element = query_by_role(heading_tree, "heading", level=3)
     assert element is None
 
 
@@ -293,6 +317,117 @@ def test_get_by_role_not_found():
     assert "Unable to find element with role 'button'" in str(exc_info.value)
 
 
+def test_get_role_for_element_shapes():
+    """Explicit roles win; implicit roles depend on tag and input type."""
+    container = html(t"""<div>
+        <INPUT type="EMAIL" /><input /><input type="checkbox" />
+        <a href="/" role="button">Go</a><span>Plain</span>
+    </div>""")
+    roles = [get_role_for_element(el) for el in get_all_elements(container)[1:]]
+    assert roles == ["textbox", "textbox", "checkbox", "button", None]
+
+
+def test_present_but_empty_attributes_differ_from_missing():
+    """A valueless role or aria-level attribute is not the same as no attribute."""
+    container = html(t"""<div>
+        <nav role>Bare role</nav>
+        <div role="heading" aria-level>Any level</div>
+        <div role="heading">No level</div>
+    </div>""")
+
+    assert query_by_role(container, "navigation") is None
+    headings = query_all_by_role(container, "heading", level=3)
+    assert [get_text_content(el) for el in headings] == ["Any level"]
+
+
+def test_find_form_controls_deep_inside_label():
+    """Controls nested deeply inside a <label> are found without recursion."""
+    label = html(t"<label>Deep<input /><select></select></label>")
+    for _ in range(1200):
+        label.children[1] = Element("span", {}, [label.children[1]])
+
+    assert [el.tag for el in _find_form_controls(label)] == ["input", "select"]
+
+
+def test_nested_label_finds_controls_inside_fragments():
+    """Controls reached through a Fragment child of a <label> are found."""
+    label = html(t"<label>Email</label>")
+    label.children.append(html(t'<span>Address</span><input type="email" />'))
+    container = Element("div", {}, [label])
+
+    assert isinstance(label.children[1], Fragment)
+    assert [el.tag for el in _find_form_controls(label)] == ["input"]
+    assert get_by_label_text(container, "Email").attrs["type"] == "email"
+
+
+def test_role_matcher_is_shared_per_role():
+    assert _role_matcher("button") is _role_matcher("button")
+    assert _role_matcher("button") is not _role_matcher("link")
+
+    button = html(t"<button>Go</button>")
+    assert _role_matcher("button")(button) is True
+    assert _role_matcher("link")(button) is False
+
+
+def test_role_matcher_tag_prefilter_agrees_with_get_role_for_element():
+    container = html(t"""<div>
+        <button>Go</button><summary>More</summary><a href="/">Home</a>
+        <input /><input type="checkbox" /><input type="date" /><input type="submit" />
+        <textarea></textarea><h3>Title</h3><li>Item</li><p>Text</p>
+        <div role="button">Fake</div><span role="">Blank</span><h2 role="tab">Tab</h2>
+    </div>""")
+    elements = get_all_elements(container)
+    elements.append(Element("BUTTON", {}, []))
+    roles = {get_role_for_element(el) for el in elements} | {"dialog", "textbox"}
+
+    for role in roles - {None}:
+        assert [_role_matcher(role)(el) for el in elements] == [
+            get_role_for_element(el) == role for el in elements
+        ], role
+
+
+def test_role_early_exit_counts_matches_not_elements():
+    """Early exit stops after enough role matches, however late they appear."""
+    container = html(t"""<div>
+        <p>One</p><p>Two</p><p>Three</p>
+        <button>First</button><button>Second</button><button>Third</button>
+    </div>""")
+
+    results = query_all_by_role(container, "button", _max_results=2)
+    assert [get_text_content(el) for el in results] == ["First", "Second"]
+
+    element = query_by_role(container, "button", name="Third")
+    assert element is not None
+    assert get_text_content(element) == "Third"
+
+
+def test_role_argument_may_be_a_str_subclass():
+    class Role(StrEnum):
+        BUTTON = "button"
+
+    container = html(t"<div><button>Go</button><a href='/'>Home</a></div>")
+
+    assert query_all_by_role(container, Role.BUTTON) == query_all_by_role(
+        container, "button"
+    )
+    assert get_by_role(container, Role.BUTTON, name="Go").tag == "button"
+
+
+@pytest.mark.parametrize("as_index", [False, True], ids=["tree", "index"])
+def test_test_id_attribute_may_be_a_str_subclass(as_index):
+    class Attribute(StrEnum):
+        QA = "data-qa"
+
+    container = html(t'<div><p data-qa="x">Hi</p><p data-qa="y">Bye</p></div>')
+    searched = build_index(container) if as_index else container
+
+    assert get_by_test_id(searched, "x", attribute=Attribute.QA).tag == "p"
+    assert [
+        el.attrs["data-qa"]
+        for el in query_all_by_test_id(searched, "y", attribute=Attribute.QA)
+    ] == ["y"]
+
+
 def test_get_by_role_multiple_elements():
     container = html(t"""<div>
         <button>First</button>
@@ -401,6 +536,48 @@ def test_multiple_query_methods_same_element():
     assert by_text is by_test_id is by_role
 
 
+def test_multi_query_matches_single_queries_in_one_walk():
+    container = html(t"""<div data-testid="page" role="main">
+        <nav><a href="/">Home</a></nav>
+        <button data-testid="submit" aria-label="Submit form">Submit</button>
+        <button>Cancel</button>
+        <P>Submit feedback</P>
+    </div>""")
+
+    found = multi_query(
+        container, text="Submit", test_id="submit", role="button", tag="p"
+    )
+
+    assert list(found) == ["text", "test_id", "role", "tag"]
+    assert found["text"] is query_all_by_text(container, "Submit")[0]
+    assert found["test_id"] is query_by_test_id(container, "submit")
+    # Several buttons match: the first one is returned instead of raising
+    assert found["role"] is found["test_id"]
+    assert found["tag"] is query_by_tag_name(container, "P")
+
+    # Like the single queries, test_id and tag can match the container itself,
+    # while text and role skip it
+    found = multi_query(container, test_id="page", tag="div", role="main")
+    assert found == {"test_id": container, "tag": container, "role": None}
+    assert query_by_role(container, "main") is None
+    assert multi_query(container, text="Home") == {
+        "text": query_by_role(container, "navigation")
+    }
+
+
+def test_multi_query_on_index_and_fragment():
+    fragment = html(t"<h1>Title</h1><p data-testid='intro'>Hello</p>")
+    index = build_index(fragment)
+
+    for container in (fragment, index):
+        found = multi_query(container, role="heading", test_id="intro", text="Nope")
+        assert found["role"] is not None and found["role"].tag == "h1"
+        assert found["test_id"] is not None and found["test_id"].tag == "p"
+        assert found["text"] is None
+
+    assert multi_query(fragment) == {}
+
+
 def test_fragment_as_container():
     fragment = html(t"<div>First</div><span>Second</span>")
 
@@ -415,27 +592,29 @@ def test_fragment_as_container():
 # ===== Name Matching Tests =====
 
 
-def test_role_with_name_text_content():
-    """Test name matching using text content."""
-    container = html(t"""<div>
+@pytest.fixture(scope="module")
+def named_buttons():
+    return html(t"""<div>
         <button>Save Document</button>
         <button>Cancel Operation</button>
         <button>Delete File</button>
     </div>""")
 
-    # Test substring matching
-    element = query_by_role(container, "button", name="Save")
-    assert element is not None
-    assert "Save Document" in get_text_content(element)
-
-    element = query_by_role(container, "button", name="Cancel")
-    assert element is not None
-    assert "Cancel Operation" in get_text_content(element)
 
-    # Test full text matching
-    element = query_by_role(container, "button", name="Delete File")
+@pytest.mark.parametrize(
+    "name, text",
+    [
+        ("Save", "Save Document"),
+        ("Cancel", "Cancel Operation"),
+        ("Delete File", "Delete File"),
+    ],
+    ids=["substring", "other_substring", "full_text"],
+)
+def test_role_with_name_text_content(named_buttons, name, text):
+    """Test name matching using text content."""
+    element = query_by_role(named_buttons, "button", name=name)
     assert element is not None
-    assert "Delete File" in get_text_content(element)
+    assert get_text_content(element) == text
 
 
 def test_role_with_name_aria_label():
@@ -472,25 +651,28 @@ def test_role_with_name_link_text():
     assert element.attrs["href"] == "/about"
 
 
-def test_role_with_name_image_alt():
-    """Test name matching for images using alt text."""
-    container = html(t"""<div>
+@pytest.fixture(scope="module")
+def named_images():
+    return html(t"""<div>
         <img src="logo.png" alt="Company Logo" />
         <img src="avatar.jpg" alt="User Avatar" />
         <img src="icon.svg" alt="Settings Icon" />
     </div>""")
 
-    element = query_by_role(container, "img", name="Company")
-    assert element is not None
-    assert element.attrs["alt"] == "Company Logo"
-
-    element = query_by_role(container, "img", name="Avatar")
-    assert element is not None
-    assert element.attrs["alt"] == "User Avatar"
 
-    element = query_by_role(container, "img", name="Settings")
+@pytest.mark.parametrize(
+    "name, alt",
+    [
+        ("Company", "Company Logo"),
+        ("Avatar", "User Avatar"),
+        ("Settings", "Settings Icon"),
+    ],
+)
+def test_role_with_name_image_alt(named_images, name, alt):
+    """Test name matching for images using alt text."""
+    element = query_by_role(named_images, "img", name=name)
     assert element is not None
-    assert element.attrs["alt"] == "Settings Icon"
+    assert element.attrs["alt"] == alt
 
 
 def test_role_with_name_not_found():
@@ -587,57 +769,56 @@ def test_form_controls_name_matching():
 # ===== Link Href Support Tests =====
 
 
-def test_link_name_includes_href():
-    """Test that link names include href for comprehensive matching."""
-    container = html(t"""<div>
+@pytest.fixture(scope="module")
+def href_links():
+    return html(t"""<div>
         <a href="/docs">Documentation</a>
         <a href="/api/v1">API Reference</a>
         <a href="https://example.com">External Link</a>
     </div>""")
 
-    # Match by href path
-    element = query_by_role(container, "link", name="/docs")
-    assert element is not None
-    assert element.attrs["href"] == "/docs"
-
-    # Match by href with version
-    element = query_by_role(container, "link", name="v1")
-    assert element is not None
-    assert element.attrs["href"] == "/api/v1"
 
-    # Match by domain in href
-    element = query_by_role(container, "link", name="example.com")
+@pytest.mark.parametrize(
+    "name, href",
+    [
+        ("/docs", "/docs"),
+        ("v1", "/api/v1"),
+        ("example.com", "https://example.com"),
+    ],
+    ids=["path", "version", "domain"],
+)
+def test_link_name_includes_href(href_links, name, href):
+    """Test that link names include href for comprehensive matching."""
+    element = query_by_role(href_links, "link", name=name)
     assert element is not None
-    assert element.attrs["href"] == "https://example.com"
+    assert element.attrs["href"] == href
 
 
-def test_link_name_text_and_href_combined():
-    """Test that both text content and href are searchable for links."""
-    container = html(t"""<div>
+@pytest.fixture(scope="module")
+def text_and_href_links():
+    return html(t"""<div>
         <a href="/download">Download Now</a>
         <a href="/signup">Join Today</a>
         <a href="/admin/users">User Management</a>
     </div>""")
 
-    # Match by text content
-    element = query_by_role(container, "link", name="Download")
-    assert element is not None
-    assert "Download Now" in get_text_content(element)
-
-    # Match by href path
-    element = query_by_role(container, "link", name="/signup")
-    assert element is not None
-    assert element.attrs["href"] == "/signup"
 
-    # Match by part of href path
-    element = query_by_role(container, "link", name="admin")
-    assert element is not None
-    assert element.attrs["href"] == "/admin/users"
-
-    # Match by text content when href doesn't contain the term
-    element = query_by_role(container, "link", name="Join")
+@pytest.mark.parametrize(
+    "name, href",
+    [
+        ("Download", "/download"),
+        ("/signup", "/signup"),
+        ("admin", "/admin/users"),
+        # Text content matches when href doesn't contain the term
+        ("Join", "/signup"),
+    ],
+    ids=["text", "href_path", "href_part", "text_not_in_href"],
+)
+def test_link_name_text_and_href_combined(text_and_href_links, name, href):
+    """Test that both text content and href are searchable for links."""
+    element = query_by_role(text_and_href_links, "link", name=name)
     assert element is not None
-    assert "Join Today" in get_text_content(element)
+    assert element.attrs["href"] == href
 
 
 def test_link_href_only_no_text():
@@ -664,9 +845,9 @@ def test_link_href_only_no_text():
     assert element.attrs["href"] == "/profile"
 
 
-def test_link_complex_href_patterns():
-    """Test complex href patterns and matching."""
-    container = html(t"""<div>
+@pytest.fixture(scope="module")
+def complex_href_links():
+    return html(t"""<div>
         <a href="https://api.github.com/repos/user/repo">GitHub API</a>
         <a href="mailto:contact@example.com">Contact Us</a>
         <a href="tel:+1-555-123-4567">Call Now</a>
@@ -674,43 +855,26 @@ def test_link_complex_href_patterns():
         <a href="?page=2&sort=name">Next Page</a>
     </div>""")
 
-    # Match by domain in URL
-    element = query_by_role(container, "link", name="github.com")
-    assert element is not None
-    href = element.attrs.get("href", "")
-    assert href is not None and "api.github.com" in href
-
-    # Match by email protocol and domain
-    element = query_by_role(container, "link", name="mailto:")
-    assert element is not None
-    assert element.attrs["href"] == "mailto:contact@example.com"
-
-    element = query_by_role(container, "link", name="example.com")
-    assert element is not None
-    href = element.attrs.get("href", "")
-    assert href is not None and "contact@example.com" in href
-
-    # Match by phone protocol
-    element = query_by_role(container, "link", name="tel:")
-    assert element is not None
-    assert element.attrs["href"] == "tel:+1-555-123-4567"
 
-    # Match by phone number part
-    element = query_by_role(container, "link", name="555")
-    assert element is not None
-    href = element.attrs.get("href", "")
-    assert href is not None and "555" in href
-
-    # Match by fragment identifier
-    element = query_by_role(container, "link", name="#section")
-    assert element is not None
-    assert element.attrs["href"] == "#section-1"
-
-    # Match by query parameters
-    element = query_by_role(container, "link", name="page=2")
+@pytest.mark.parametrize(
+    "name, href_part",
+    [
+        ("github.com", "api.github.com"),
+        ("mailto:", "mailto:contact@example.com"),
+        ("example.com", "contact@example.com"),
+        ("tel:", "tel:+1-555-123-4567"),
+        ("555", "555"),
+        ("#section", "#section-1"),
+        ("page=2", "page=2"),
+    ],
+    ids=["domain", "mailto", "email_domain", "tel", "phone_part", "fragment", "query"],
+)
+def test_link_complex_href_patterns(complex_href_links, name, href_part):
+    """Test complex href patterns and matching."""
+    element = query_by_role(complex_href_links, "link", name=name)
     assert element is not None
-    href = element.attrs.get("href", "")
-    assert href is not None and "page=2" in href
+    href = element.attrs.get("href")
+    assert href is not None and href_part in href
 
 
 def test_link_priority_aria_label_over_href():
@@ -1001,6 +1165,22 @@ def test_get_by_tag_name_multiple_elements():
         get_by_tag_name(container, "p")
 
 
+def test_tag_name_early_exit_with_attrs():
+    """Single-element tag queries stop at the first matches that pass attrs."""
+    container = html(t"""<div>
+        <a href="/a">A</a>
+        <a href="/b" rel="next">B</a>
+        <a href="/c" rel="next">C</a>
+    </div>""")
+
+    element = query_by_tag_name(container, "a", attrs={"rel": "next"})
+    assert element is not None
+    assert element.attrs["href"] == "/b"
+
+    results = query_all_by_tag_name(container, "a", attrs={"rel": "next"})
+    assert [el.attrs["href"] for el in results] == ["/b", "/c"]
+
+
 def test_query_all_by_tag_name():
     """Test query_all_by_tag_name finds all matching elements."""
     container = html(t"""<div>
@@ -1174,6 +1354,53 @@ def test_tag_name_in_class_combined_with_attrs():
     assert result is None
 
 
+def test_tag_attrs_matcher_is_shared_per_filter():
+    link = html(t'<a href="/home" class="nav-link">Home</a>')
+    filters = (("href", "/home"), ("in_class", "nav"))
+
+    assert _tag_attrs_matcher("a", filters) is _tag_attrs_matcher("a", filters)
+    assert _tag_attrs_matcher("a", filters)(link) is True
+    assert _tag_attrs_matcher("a", (("in_class", "footer"),))(link) is False
+    assert _tag_attrs_matcher("p", filters)(link) is False
+
+
+@pytest.mark.parametrize(
+    "tag, attrs",
+    [
+        ("A", {"href": "/home"}),
+        ("a", {"in_class": "nav"}),
+        ("a", {"in_class": "link", "href": "/home"}),
+        ("div", {"id": "root"}),
+        ("a", {"rel": "missing"}),
+    ],
+)
+def test_tag_name_attrs_filter_matches_tree_and_index(tag, attrs):
+    container = html(t"""<div id="root">
+        <a href="/home" class="nav-link active">Nav Home</a>
+        <a href="/about" class="nav-link">About</a>
+        <a href="/home" class="footer-link">Footer Home</a>
+        <a href="/plain">Plain</a>
+    </div>""")
+    index = build_index(container)
+
+    expected = [
+        el
+        for el in get_all_elements(container)
+        if el.tag == tag.lower()
+        and all(
+            attr_value in (el.attrs.get("class") or "")
+            if attr_name == "in_class"
+            else el.attrs.get(attr_name) == attr_value
+            for attr_name, attr_value in attrs.items()
+        )
+    ]
+    from_tree = query_all_by_tag_name(container, tag, attrs=attrs)
+    from_index = query_all_by_tag_name(index, tag, attrs=attrs)
+
+    assert [id(el) for el in from_tree] == [id(el) for el in expected]
+    assert [id(el) for el in from_index] == [id(el) for el in expected]
+
+
 def test_tag_name_in_class_no_match():
     """Test in_class when class doesn't match."""
     container = html(
@@ -1371,18 +1598,63 @@ def test_get_by_id_duplicate_ids_raise_multiple():
     assert isinstance(exc.value, MultipleElementsError)
 
 
+def test_id_queries_stop_early_but_report_true_duplicate_count():
+    container = html(t"""<div>
+        <span id="dup" data-testid="dup">X</span>
+        <span id="dup" data-testid="dup">Y</span>
+        <span id="dup" data-testid="dup">Z</span>
+    </div>""")
+
+    first = query_by_id(container, "dup")
+    assert first is not None
+    assert get_text_content(first) == "X"
+    assert query_by_test_id(container, "dup") is first
+
+    with pytest.raises(MultipleElementsError) as exc:
+        get_by_id(container, "dup")
+    assert exc.value.count == 3
+
+    with pytest.raises(MultipleElementsError) as exc:
+        get_by_test_id(container, "dup")
+    assert exc.value.count == 3
+
+
+@pytest.mark.parametrize(
+    "get_by, value",
+    [
+        (get_by_role, "button"),
+        (get_by_text, "Go"),
+        (get_by_class, "btn"),
+        (get_by_tag_name, "button"),
+    ],
+)
+def test_get_by_multiple_elements_reports_true_count(get_by, value):
+    container = html(t"""<div>
+        <button class="btn">Go</button>
+        <button class="btn">Go</button>
+        <button class="btn">Go</button>
+    </div>""")
+
+    with pytest.raises(MultipleElementsError) as exc:
+        get_by(container, value)
+    assert exc.value.count == 3
+
+
 # ===== Implicit Role Tests =====
 
 
-def test_implicit_role_landmark_roles():
-    """Test landmark role type hints work."""
-    simple_document = html(t"""<div>
+@pytest.fixture(scope="module")
+def simple_document():
+    return html(t"""<div>
         <nav>Navigation</nav>
         <main>Main content</main>
         <button>Click me</button>
         <h1>Title</h1>
     </div>""")
 
+
+def test_implicit_role_landmark_roles(simple_document):
+    """Test landmark role type hints work."""
     nav = get_by_role(simple_document, "navigation")
     assert nav.tag == "nav"
 
@@ -1390,28 +1662,14 @@ def test_implicit_role_landmark_roles():
     assert main.tag == "main"
 
 
-def test_implicit_role_widget_roles():
+def test_implicit_role_widget_roles(simple_document):
     """Test widget role type hints work."""
-    simple_document = html(t"""<div>
-        <nav>Navigation</nav>
-        <main>Main content</main>
-        <button>Click me</button>
-        <h1>Title</h1>
-    </div>""")
-
     button = get_by_role(simple_document, "button")
     assert button.tag == "button"
 
 
-def test_implicit_role_document_structure_roles():
+def test_implicit_role_document_structure_roles(simple_document):
     """Test document structure role type hints work."""
-    simple_document = html(t"""<div>
-        <nav>Navigation</nav>
-        <main>Main content</main>
-        <button>Click me</button>
-        <h1>Title</h1>
-    </div>""")
-
     heading = get_by_role(simple_document, "heading")
     assert heading.tag == "h1"
 
@@ -1616,6 +1874,67 @@ def test_aria_labelledby_multiple_references():
     assert element1 is element2
 
 
+def test_label_text_early_exit_keeps_strategy_order_and_true_count():
+    document = html(t"""
+        <div>
+            <label for="a">Name</label>
+            <input id="a" type="text" />
+            <input aria-label="Name" type="text" />
+            <label>Name <select></select></label>
+        </div>
+    """)
+
+    all_matches = query_all_by_label_text(document, "Name")
+    assert [el.tag for el in all_matches] == ["input", "input", "select"]
+    assert (
+        query_all_by_label_text(document, "Name", _max_results=2) == (all_matches[:2])
+    )
+    # aria-label matches come first
+    assert "aria-label" in all_matches[0].attrs
+    assert query_by_label_text(document, "Name") is all_matches[0]
+
+    with pytest.raises(MultipleElementsError) as exc:
+        get_by_label_text(document, "Name")
+    assert exc.value.count == 3
+
+
+def test_aria_labelledby_shared_label_matches_every_control():
+    document = html(t"""
+        <div>
+            <span id="qty">Quantity</span>
+            <input type="number" aria-labelledby="qty" />
+            <select aria-labelledby="qty"></select>
+            <textarea aria-labelledby="other qty"></textarea>
+        </div>
+    """)
+
+    assert [el.tag for el in query_all_by_label_text(document, "Quantity")] == [
+        "input",
+        "select",
+        "textarea",
+    ]
+    assert query_all_by_label_text(document, "Price") == []
+
+
+def test_label_references_resolve_every_element_with_the_id():
+    """Duplicate ids resolve to all their elements, in document order."""
+    document = html(t"""
+        <div>
+            <input id="dup" type="text" />
+            <label for="dup">Shared</label>
+            <select id="dup"></select>
+            <span id="note">Hint</span>
+            <textarea aria-labelledby="missing note"></textarea>
+        </div>
+    """)
+
+    assert [el.tag for el in query_all_by_label_text(document, "Shared")] == [
+        "input",
+        "select",
+    ]
+    assert [el.tag for el in query_all_by_label_text(document, "Hint")] == ["textarea"]
+
+
 def test_multiple_labeling_methods():
     """Test element with multiple labeling methods (should not duplicate)."""
     document = html(t"""
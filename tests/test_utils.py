@@ -4,11 +4,16 @@ Tests for aria_testing.utils module.
 
 import re
 
-from tdom import Comment, Text
+from tdom import Comment, Element, Text
 from tdom.processor import html
 
 from aria_testing.utils import (
+    _casefold_tag,
+    _prepare_matcher,
+    _text_contents,
     find_elements_by_tag,
+    find_elements_by_tags,
+    get_accessible_name,
     get_all_elements,
     get_text_content,
     matches_text,
@@ -51,6 +56,27 @@ def test_get_text_content_empty_element():
     assert get_text_content(element) == ""
 
 
+def test_get_text_content_deeply_nested():
+    element = html(t"<p>Start <b>end</b></p>")
+    for _ in range(1200):
+        element = Element("span", {}, [element, Text("!")])
+
+    assert get_text_content(element) == "Start end" + "!" * 1200
+
+
+def test_text_contents_match_get_text_content():
+    container = html(t"""<div>
+        Intro <p>Hello <b>big <i>wide</i></b> world</p>
+        <!-- skipped --><ul><li>One</li><li></li></ul>tail
+    </div>""")
+
+    texts = _text_contents(container)
+
+    assert len(texts) == len(get_all_elements(container))
+    for element in get_all_elements(container):
+        assert texts[id(element)] == get_text_content(element)
+
+
 def test_normalize_text_basic_normalization():
     assert normalize_text("  hello  world  ") == "hello world"
 
@@ -104,6 +130,31 @@ def test_matches_text_normalization():
     assert matches_text("  hello  world  ", "hello world", normalize=False) is False
 
 
+def test_normalize_text_matches_regex_whitespace_semantics():
+    text = "\u00a0hello\r\n\x0b world\u2003\f"
+    expected = re.sub(r"\s+", " ", text).strip()
+    assert normalize_text(text) == expected == "hello world"
+
+
+def test_prepare_matcher_forms():
+    assert _prepare_matcher("  Hello  World ", True) == ("Hello World", "hello world")
+    assert _prepare_matcher("  Hello ", False) == ("  Hello ", "  hello ")
+
+
+def test_matches_text_exact_fast_path_and_normalized_fallback():
+    assert matches_text("Submit", "Submit") is True
+    assert matches_text("\n  Submit\t", "Submit") is True
+    assert matches_text("Submit", "  Submit  ") is True
+    assert matches_text("Submit", "submit") is False
+
+
+def test_matches_text_substring_fast_path_and_casefold_fallback():
+    assert matches_text("Click  the Save button", "Save", exact=False) is True
+    assert matches_text("Click  the Save button", "the save", exact=False) is True
+    assert matches_text("Straße", "STRASSE", exact=False) is True
+    assert matches_text("Save", "Saved", exact=False) is False
+
+
 def test_find_elements_by_tag_basic():
     container = html(t"<div><button>A</button><input /><button>B</button></div>")
 
@@ -128,6 +179,32 @@ def test_find_elements_by_tag_nested():
     assert len(results) == 2
 
 
+def test_find_elements_by_tag_max_results():
+    container = html(t"<div><p>One</p><p>Two</p><p>Three</p></div>")
+
+    results = find_elements_by_tag(container, "p", max_results=2)
+    assert [get_text_content(el) for el in results] == ["One", "Two"]
+
+
+def test_find_elements_by_tags_single_pass_buckets():
+    container = html(t"""<form>
+        <input name="q" /><button>Go</button><a href="/help">Help</a><button>Reset</button>
+    </form>""")
+
+    results = find_elements_by_tags(container, ["BUTTON", "a", "select"])
+    assert list(results) == ["button", "a", "select"]
+    assert [get_text_content(el) for el in results["button"]] == ["Go", "Reset"]
+    assert len(results["a"]) == 1
+    assert results["select"] == []
+
+
+def test_casefold_tag_ascii_and_unicode():
+    assert _casefold_tag("BUTTON") == "button"
+    assert _casefold_tag("Straße") == "strasse"
+    # Results are interned so repeated lookups share one object
+    assert _casefold_tag("DiV") is _casefold_tag("div")
+
+
 def test_get_all_elements_simple():
     container = html(t"<div><p>Para</p><span>Span</span>some text</div>")
 
@@ -155,3 +232,29 @@ def test_get_all_elements_fragment():
 
     results = get_all_elements(fragment)
     assert len(results) == 2
+
+
+def test_get_all_elements_skip_root():
+    container = html(t"<div><p>Para</p><span>Span</span></div>")
+    fragment = html(t"<div>First</div><span>Second</span>")
+
+    results = get_all_elements(container, skip_root=True)
+    assert [el.tag for el in results] == ["p", "span"]
+    # The container's own children are not consumed by the traversal
+    assert len(container.children) == 2
+    # Fragments have no root element to skip
+    assert len(get_all_elements(fragment, skip_root=True)) == 2
+
+
+def test_get_accessible_name_role_specific_rules():
+    link = html(t'<a href="/docs">Docs</a>')
+    empty_alt = html(t'<img alt="" title="Ignored" />')
+    textbox = html(t'<input placeholder="Search" />')
+    labelled = html(t'<button aria-label="Close">X</button>')
+
+    assert get_accessible_name(link, "link") == "Docs /docs"
+    assert get_accessible_name(empty_alt, "img") == ""
+    assert get_accessible_name(textbox, "textbox") == "Search"
+    assert get_accessible_name(labelled, "button") == "Close"
+    # Roles without a specific rule use the text content fallback
+    assert get_accessible_name(link, None) == "Docs"